@@ -64,18 +64,18 @@ class RestAPI:
         return jsonify(out), 200
 
     def get_game_info(self, game_id: str) -> Tuple[Response, int]:
-        for env in self.arcade.available_environments:
-            if env.game_id == game_id or env.game_id.startswith(f"{game_id}-"):
-                return jsonify(
-                    env.model_dump(
-                        mode="json",
-                        exclude={
-                            "private_tags",
-                            "level_tags",
-                            "baseline_actions",
-                        },
-                    )
-                ), 200
+        env = self.arcade.get_environment(game_id)
+        if env is not None:
+            return jsonify(
+                env.model_dump(
+                    mode="json",
+                    exclude={
+                        "private_tags",
+                        "level_tags",
+                        "baseline_actions",
+                    },
+                )
+            ), 200
         return jsonify(
             {
                 "error": APIError.SERVER_ERROR,
@@ -497,5 +497,6 @@ class RestAPI:
 
     def cleanup_environment(self, guid: str) -> None:
         with self._cache_lock:
-            if guid in self._environmentCache:
-                del self._environmentCache[guid]
+            environment = self._environmentCache.pop(guid, None)
+        if environment is not None:
+            environment.close()
@@ -6,6 +6,7 @@ import sys
 import threading
 from datetime import datetime, timezone
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -36,6 +37,14 @@ except (OSError, PermissionError, FileNotFoundError):
     pass
 
 
+# Shared by the stateless GET requests (game list, anonymous key, metadata and
+# source downloads) so they reuse pooled connections. Cookies are refused so
+# nothing leaks between Arcade instances; scorecard traffic keeps its own
+# per-instance session.
+_session = requests.Session()
+_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
 class OperationMode(str, Enum):
     """Mode for environment discovery and usage.
 
@@ -131,18 +140,18 @@ class Arcade:
             self.logger = logger
         else:
             self.logger = logging.getLogger(__name__)
-            self.logger.setLevel(logging.INFO)
-            # Remove existing handlers to avoid duplicates
-            self.logger.handlers.clear()
-            # Create STDOUT handler
-            stdout_handler = logging.StreamHandler(sys.stdout)
-            stdout_handler.setLevel(logging.INFO)
-            formatter = logging.Formatter(
-                "%(asctime)s | %(levelname)s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            stdout_handler.setFormatter(formatter)
-            self.logger.addHandler(stdout_handler)
+            # The module logger is shared by every Arcade; configure it once
+            if not self.logger.handlers:
+                self.logger.setLevel(logging.INFO)
+                # Create STDOUT handler
+                stdout_handler = logging.StreamHandler(sys.stdout)
+                stdout_handler.setLevel(logging.INFO)
+                formatter = logging.Formatter(
+                    "%(asctime)s | %(levelname)s | %(message)s",
+                    datefmt="%Y-%m-%d %H:%M:%S",
+                )
+                stdout_handler.setFormatter(formatter)
+                self.logger.addHandler(stdout_handler)
 
         # Create scorecard manager
         self.scorecard_manager = ScorecardManager(recordings_dir=self.recordings_dir)
@@ -150,9 +159,15 @@ class Arcade:
         # Store default scorecard_id (will be created on first make() call if needed)
         self._default_scorecard_id: Optional[str] = None
 
-        # Scan for available environments
-        self.available_environments: list[EnvironmentInfo] = []
-        self._scan_for_environments()
+        # Available environments, scanned from environments_dir on first use
+        self._available_environments: list[EnvironmentInfo] = []
+        self._environments_scanned = False
+        self._environments_lock = threading.Lock()
+        # Lookup indexes kept in sync with available_environments
+        self._environments_by_id: dict[str, EnvironmentInfo] = {}
+        self._environments_by_base_id: dict[str, list[EnvironmentInfo]] = {}
+        # Latest downloaded version per base game_id, filled in by make()
+        self._latest_by_base_id: dict[str, EnvironmentInfo] = {}
 
         if (
             self.operation_mode == OperationMode.ONLINE
@@ -194,7 +209,7 @@ class Arcade:
         headers = {
             "Accept": "application/json",
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         json_data = response.json()
         if "api_key" in json_data:
@@ -204,6 +219,32 @@ class Arcade:
             return str(key)
         return ""
 
+    @property
+    def available_environments(self) -> list[EnvironmentInfo]:
+        """Environments found in environments_dir, plus any fetched from the API.
+
+        environments_dir is scanned on first access rather than in the constructor.
+        """
+        self._ensure_environments_scanned()
+        return self._available_environments
+
+    def _ensure_environments_scanned(self) -> None:
+        """Scan environments_dir once, the first time environments are needed."""
+        if self._environments_scanned:
+            return
+        with self._environments_lock:
+            if not self._environments_scanned:
+                self._scan_for_environments()
+                self._environments_scanned = True
+
+    def _add_environment(self, env_info: EnvironmentInfo) -> None:
+        """Append an environment and index it by game_id and base game_id."""
+        self._available_environments.append(env_info)
+        self._environments_by_id[env_info.game_id] = env_info
+        base_id = env_info.game_id.split("-", 1)[0]
+        self._environments_by_base_id.setdefault(base_id, []).append(env_info)
+        self._latest_by_base_id.pop(base_id, None)
+
     def _scan_for_environments(self) -> None:
         """Scan environments_dir for metadata.json files and load them as EnvironmentInfo."""
         if self.environments_dir is None:
@@ -216,12 +257,13 @@ class Arcade:
         # Recursively find all metadata.json files
         for metadata_file in environments_path.rglob("metadata.json"):
             try:
-                # Read and parse the JSON file
-                json_data = metadata_file.read_text(encoding="utf-8")
-                env_info = EnvironmentInfo.model_validate_json(json_data)
+                # Parse the raw bytes; pydantic decodes UTF-8 while parsing
+                env_info = EnvironmentInfo.model_validate_json(
+                    metadata_file.read_bytes()
+                )
                 # Set local_dir to the parent directory of metadata.json
                 env_info.local_dir = str(metadata_file.parent)
-                self.available_environments.append(env_info)
+                self._add_environment(env_info)
             except Exception as e:
                 # Skip files that fail to load (invalid JSON, missing fields, etc.)
                 self.logger.warning(
@@ -243,7 +285,7 @@ class Arcade:
                 "Accept": "application/json",
             }
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
             # Parse response
@@ -274,11 +316,10 @@ class Arcade:
                     continue
 
             # Merge with existing environments, removing duplicates by game_id
-            existing_game_ids = {env.game_id for env in self.available_environments}
+            self._ensure_environments_scanned()
             for api_env in api_environments:
-                if api_env.game_id not in existing_game_ids:
-                    self.available_environments.append(api_env)
-                    existing_game_ids.add(api_env.game_id)
+                if api_env.game_id not in self._environments_by_id:
+                    self._add_environment(api_env)
 
             if api_environments:
                 self.logger.info(
@@ -306,6 +347,24 @@ class Arcade:
         """
         return self.available_environments
 
+    def get_environment(self, game_id: str) -> Optional[EnvironmentInfo]:
+        """Look up an available environment by game_id.
+
+        Args:
+            game_id: Full game identifier ('ls20-1234abcd') or base identifier ('ls20').
+                For a base identifier the first environment with that base is returned.
+
+        Returns:
+            EnvironmentInfo if found, None otherwise.
+        """
+        self._ensure_environments_scanned()
+        env_info = self._environments_by_id.get(game_id)
+        if env_info is None:
+            matching_envs = self._environments_by_base_id.get(game_id)
+            if matching_envs:
+                env_info = matching_envs[0]
+        return env_info
+
     def _create_renderer_from_mode(
         self,
         render_mode: Optional[str],
@@ -679,43 +738,34 @@ class Arcade:
         Returns:
             LocalEnvironmentWrapper if found, None otherwise.
         """
-        # Filter environments by base game_id (first 4 characters)
-        matching_envs = []
-        for env in self.available_environments:
-            # Extract base_id from env.game_id (e.g. "ls20" or "ls20-1234abcd")
-            env_base_id = env.game_id.split("-", 1)[0]
-            if env_base_id == game_id:
-                matching_envs.append(env)
+        self._ensure_environments_scanned()
+        matching_envs = self._environments_by_base_id.get(game_id, [])
 
         if not matching_envs:
             self.logger.error(
                 f"Game {game_id} not found in scanned environments. "
-                f"Available games: {sorted(set(e.game_id.split('-', 1)[0] for e in self.available_environments))}"
+                f"Available games: {sorted(self._environments_by_base_id)}"
             )
             return None
 
         # If version is specified, find exact match
         if version:
-            for env in matching_envs:
-                # Extract version from env.game_id (everything after '-')
-                env_version = (
-                    env.game_id.split("-", 1)[1] if "-" in env.game_id else None
-                )
-                if env_version == version:
-                    if env.local_dir is None:
-                        self.logger.error(
-                            f"Found game {game_id}-{version} but local_dir is None"
-                        )
-                        return None
-                    return self._create_wrapper(
-                        env,
-                        scorecard_id,
-                        save_recording,
-                        include_frame_data,
-                        seed,
-                        render_mode,
-                        renderer,
+            env = self._environments_by_id.get(f"{game_id}-{version}")
+            if env is not None:
+                if env.local_dir is None:
+                    self.logger.error(
+                        f"Found game {game_id}-{version} but local_dir is None"
                     )
+                    return None
+                return self._create_wrapper(
+                    env,
+                    scorecard_id,
+                    save_recording,
+                    include_frame_data,
+                    seed,
+                    render_mode,
+                    renderer,
+                )
 
             self.logger.error(
                 f"Game {game_id} with version {version} not found. "
@@ -724,13 +774,14 @@ class Arcade:
             return None
 
         # No version specified - return the latest downloaded one
-        # Sort by date_downloaded (most recent first)
-        matching_envs.sort(
-            key=lambda e: e.date_downloaded
-            or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
-        )
-        latest_env = matching_envs[0]
+        latest_env = self._latest_by_base_id.get(game_id)
+        if latest_env is None:
+            latest_env = max(
+                matching_envs,
+                key=lambda e: e.date_downloaded
+                or datetime.min.replace(tzinfo=timezone.utc),
+            )
+            self._latest_by_base_id[game_id] = latest_env
 
         if latest_env.local_dir is None:
             self.logger.error(f"Found game {game_id} but local_dir is None")
@@ -817,7 +868,7 @@ class Arcade:
         }
 
         try:
-            response = requests.get(metadata_url, headers=headers, timeout=10)
+            response = _session.get(metadata_url, headers=headers, timeout=10)
 
             if not response.ok:
                 self.logger.warning(
@@ -1041,7 +1092,7 @@ class Arcade:
                 "X-Api-Key": self.arc_api_key,
                 "Accept": "application/json",
             }
-            source_response = requests.get(source_url, headers=headers, timeout=10)
+            source_response = _session.get(source_url, headers=headers, timeout=10)
             source_response.raise_for_status()
             source_code = source_response.text
 
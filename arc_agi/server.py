@@ -1,13 +1,26 @@
 from typing import Callable, Optional, Tuple
 
 from arcengine import FrameDataRaw, GameAction
-from flask import Flask, Response
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
 
 from .api import RestAPI
 from .base import Arcade
+from .models import APIError
 from .scorecard import EnvironmentScorecard
 
 
+class _CompactJSONProvider(DefaultJSONProvider):
+    """JSON provider that keeps key order and never pretty-prints, even in debug."""
+
+    sort_keys = False
+    compact = True
+
+
+# /api/cmd/<action_name> -> GameAction
+_CMD_ACTIONS: dict[str, GameAction] = {action.name: action for action in GameAction}
+
+
 def create_app(
     arcade: Arcade,
     competition_mode: bool = False,
@@ -19,6 +32,7 @@ def create_app(
 ) -> Tuple[Flask, RestAPI]:
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = _CompactJSONProvider(app)
     api = RestAPI(
         arcade=arcade,
         competition_mode=competition_mode,
@@ -35,95 +49,68 @@ def create_app(
     app.add_url_rule(
         "/api/games",
         methods=["GET"],
-        view_func=lambda: api.get_games(),
+        view_func=api.get_games,
         endpoint="games",
     )
     app.add_url_rule(
         "/api/games/<game_id>",
         methods=["GET"],
-        view_func=lambda game_id: api.get_game_info(game_id=game_id),
+        view_func=api.get_game_info,
         endpoint="game_by_id",
     )
 
     app.add_url_rule(
         "/api/scorecard/open",
         methods=["POST"],
-        view_func=lambda: api.new_scorecard(),
+        view_func=api.new_scorecard,
         endpoint="open_scorecard",
     )
     app.add_url_rule(
         "/api/scorecard/close",
         methods=["POST"],
-        view_func=lambda: api.close_scorecard(),
+        view_func=api.close_scorecard,
         endpoint="close_scorecard",
     )
     app.add_url_rule(
         "/api/scorecard/<card_id>",
         methods=["GET"],
-        view_func=lambda card_id: api.get_scorecard(card_id=card_id),
+        view_func=api.get_scorecard,
         endpoint="scorecard",
     )
     app.add_url_rule(
         "/api/scorecard/<card_id>/<game_id>",
         methods=["GET"],
-        view_func=lambda card_id, game_id: api.get_scorecard(
-            card_id=card_id, game_id=game_id
-        ),
+        view_func=api.get_scorecard,
         endpoint="scorecard_with_gameid",
     )
 
+    def cmd(action_name: str) -> Tuple[Response, int]:
+        action = _CMD_ACTIONS.get(action_name)
+        if action is None:
+            return jsonify(
+                {
+                    "error": APIError.VALIDATION_ERROR.name,
+                    "message": f"unknown action `{action_name}`",
+                }
+            ), 404
+        return api.cmd(action=action)
+
+    # Single rule for /api/cmd/RESET, /api/cmd/ACTION1, ...
     app.add_url_rule(
-        "/api/cmd/RESET",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.RESET),
-        endpoint="reset",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION1",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION1),
-        endpoint="action1",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION2",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION2),
-        endpoint="action2",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION3",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION3),
-        endpoint="action3",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION4",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION4),
-        endpoint="action4",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION5",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION5),
-        endpoint="action5",
-    )
-    app.add_url_rule(
-        "/api/cmd/ACTION6",
+        "/api/cmd/<action_name>",
         methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION6),
-        endpoint="action6",
+        view_func=cmd,
+        endpoint="cmd",
     )
-    app.add_url_rule(
-        "/api/cmd/ACTION7",
-        methods=["POST"],
-        view_func=lambda: api.cmd(action=GameAction.ACTION7),
-        endpoint="action7",
+    # Built once and returned as-is on every probe; the explicit header keeps
+    # the bare "text/plain" content type (mimetype= would add a charset)
+    healthcheck_response = Response(
+        "okay", status=200, headers={"Content-Type": "text/plain"}
     )
     app.add_url_rule(
         "/api/healthcheck",
         methods=["GET"],
-        view_func=lambda: ("okay", 200, {"Content-Type": "text/plain"}),
+        view_func=lambda: healthcheck_response,
         endpoint="healthcheck",
     )
 
@@ -1,16 +1,141 @@
 """Environment wrapper for ARC-AGI-3 environments."""
 
+import copy
 import json
 import logging
+import os
+import queue
+import threading
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-from arcengine import FrameDataRaw, GameAction
+import numpy as np
+from arcengine import FrameDataRaw, GameAction, GameState
 
 from .models import EnvironmentInfo
 from .scorecard import ScorecardManager
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# (recording file, event) pairs; None tells the writer thread to stop
+_RecordQueue = queue.Queue[Optional[tuple[str, dict[str, Any]]]]
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the JSON encoders cannot serialize natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(event: dict[str, Any]) -> bytes:
+    """Serialize a recording event to a JSONL line with the stdlib encoder."""
+    return (json.dumps(event, default=_default) + "\n").encode("utf-8")
+
+
+def _dumps_orjson(event: dict[str, Any]) -> bytes:
+    """Serialize a recording event to a JSONL line with orjson."""
+    return orjson.dumps(
+        event,
+        default=_default,
+        option=orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+# orjson serializes numpy frames natively and is much faster, use it when installed
+_dumps: Callable[[dict[str, Any]], bytes] = _dumps_orjson if HAS_ORJSON else _dumps_json
+
+
+_RECORD_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _record_worker(
+    record_queue: _RecordQueue, logger: logging.Logger, batch_size: int
+) -> None:
+    """Drain recording events from the queue and append them to their files.
+
+    Runs on a background thread so that serialization and disk writes stay
+    off the step path. Events already waiting in the queue are written
+    together, up to batch_size at a time, with a single os.write on a raw
+    file descriptor that is kept open between batches.
+    """
+    current_path: Optional[str] = None
+    fd: Optional[int] = None
+    try:
+        while True:
+            batch = [record_queue.get()]
+            while batch[-1] is not None and len(batch) < batch_size:
+                try:
+                    batch.append(record_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: dict[str, list[bytes]] = {}
+            for item in batch:
+                if item is None:
+                    continue
+                path, event = item
+                try:
+                    lines.setdefault(path, []).append(_dumps(event))
+                except Exception as e:
+                    logger.error(
+                        f"Failed to serialize recording event: {e}",
+                        exc_info=True,
+                    )
+
+            for path, chunk in lines.items():
+                try:
+                    if fd is None or path != current_path:
+                        if fd is not None:
+                            os.close(fd)
+                            fd = None
+                        fd = os.open(path, _RECORD_OPEN_FLAGS, 0o644)
+                        current_path = path
+                    _write_all(fd, b"".join(chunk))
+                except Exception as e:
+                    logger.error(
+                        f"Failed to write to recording file: {e}",
+                        exc_info=True,
+                    )
+
+            for _ in batch:
+                record_queue.task_done()
+
+            if batch[-1] is None:
+                return
+    finally:
+        if fd is not None:
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+def _stop_record_worker(record_queue: _RecordQueue, thread: threading.Thread) -> None:
+    """Ask the writer thread to finish pending events and wait for it."""
+    record_queue.put(None)
+    if thread is not threading.current_thread():
+        thread.join()
+
 
 class EnvironmentWrapper:
     """Base wrapper class for ARC-AGI-3 environments.
@@ -52,9 +177,21 @@ class EnvironmentWrapper:
         self.scorecard_manager = scorecard_manager
         self.renderer = renderer
         self._last_response: Optional[FrameDataRaw] = None
+        # action_space for _last_response, rebuilt lazily after each response
+        self._action_space: Optional[tuple[GameAction, ...]] = None
         self._guid: Optional[str] = None
         self._recording_filename: Optional[Path] = None
+        self._recording_path: Optional[str] = None
+        # Recording events are written by a background thread, in batches of up to this size
+        self._record_queue: _RecordQueue = queue.Queue(maxsize=1024)
+        self._record_thread: Optional[threading.Thread] = None
+        self._record_finalizer: Optional[
+            "weakref.finalize[[_RecordQueue, threading.Thread], EnvironmentWrapper]"
+        ] = None
+        self._record_flush_every: int = 32
         self._steps: int = 0
+        # Game guids already registered with the scorecard manager
+        self._registered_guids: set[str] = set()
         # Note: _setup_recording_file() should be called after guid is set
 
     def reset(self) -> Optional[FrameDataRaw]:
@@ -78,12 +215,34 @@ class EnvironmentWrapper:
         """
         return None
 
+    def step_many(self, actions: list[GameAction]) -> list[Optional[FrameDataRaw]]:
+        """Perform a sequence of simple actions, one step each.
+
+        Args:
+            actions: The game actions to perform, in order.
+
+        Returns:
+            One result per action, as returned by `step` (None for a failed step).
+        """
+        step = self.step
+        return [step(action) for action in actions]
+
+    def close(self) -> None:
+        """Flush any pending recording events to disk and stop the writer thread."""
+        if self._record_finalizer is not None:
+            self._record_finalizer()
+            self._record_finalizer = None
+            self._record_thread = None
+
     def _setup_recording_file(self) -> None:
         """Set up the recording file path for JSONL output."""
         if not self._guid:
             self.logger.warning("Cannot setup recording file: guid not set")
             return
 
+        # Events pending for the previous file must be written before it changes
+        self._flush_recording()
+
         try:
             # Create directory structure: {recordings_dir}/{scorecard_id}/
             recording_dir = Path(self.recordings_dir) / self.scorecard_id
@@ -92,6 +251,7 @@ class EnvironmentWrapper:
             # Create filename: {game_id}-{guid}.jsonl
             filename = f"{self.environment_info.game_id}-{self._guid}.jsonl"
             self._recording_filename = recording_dir / filename
+            self._recording_path = os.fspath(self._recording_filename)
 
             self.logger.info(f"Recording to {self._recording_filename}")
 
@@ -101,24 +261,37 @@ class EnvironmentWrapper:
                 exc_info=True,
             )
             self._recording_filename = None
+            self._recording_path = None
 
-    def _record(self, data: dict[str, Any]) -> None:
+    def _record(
+        self, data: dict[str, Any], timestamp: Optional[datetime] = None
+    ) -> None:
         """Records an event to the file.
 
         Args:
             data: Dictionary (JSON-serializable) to record.
+            timestamp: Optional time of the event, defaults to now (UTC).
         """
-        if not self.save_recording or not self._recording_filename:
+        if not self.save_recording or not self._recording_path:
             return
 
         try:
             event: dict[str, Any] = {}
-            event["timestamp"] = datetime.now(timezone.utc).isoformat()
+            # Formatted to ISO 8601 by the writer thread
+            event["timestamp"] = timestamp or datetime.now(timezone.utc)
             event["data"] = data
 
-            with open(self._recording_filename, "a", encoding="utf-8") as f:
-                json.dump(event, f)
-                f.write("\n")
+            if self._record_thread is None:
+                self._start_record_worker()
+
+            item = (self._recording_path, event)
+            try:
+                self._record_queue.put_nowait(item)
+            except queue.Full:
+                self.logger.warning(
+                    "Recording queue is full, waiting for the writer thread"
+                )
+                self._record_queue.put(item)
 
         except Exception as e:
             self.logger.error(
@@ -126,6 +299,27 @@ class EnvironmentWrapper:
                 exc_info=True,
             )
 
+    def _start_record_worker(self) -> None:
+        """Start the background thread that writes recording events."""
+        thread = threading.Thread(
+            target=_record_worker,
+            args=(self._record_queue, self.logger, self._record_flush_every),
+            daemon=True,
+            name=f"recording-{self._guid}",
+        )
+        thread.start()
+        self._record_thread = thread
+        # Flush and stop the writer once this wrapper is garbage collected or
+        # the interpreter exits, whichever comes first
+        self._record_finalizer = weakref.finalize(
+            self, _stop_record_worker, self._record_queue, thread
+        )
+
+    def _flush_recording(self) -> None:
+        """Block until all queued recording events have been written."""
+        if self._record_thread is not None:
+            self._record_queue.join()
+
     def _set_last_response(
         self, resp: FrameDataRaw, reasoning: Optional[dict[str, Any]] = None
     ) -> None:
@@ -136,44 +330,62 @@ class EnvironmentWrapper:
             reasoning: Optional reasoning dictionary to include in recording.
         """
         self._last_response = resp
+        self._action_space = None
+        self._steps += 1
+
+        # Nothing consumes the response beyond observation_space
+        if (
+            not self.save_recording
+            and self.renderer is None
+            and self.scorecard_manager is None
+        ):
+            return
 
         # Save to recording file if enabled
         if self.save_recording:
-            # Convert FrameDataRaw to JSON-serializable dict
-            data: dict[str, Any] = {
-                "game_id": resp.game_id,
-                "state": resp.state.name
-                if hasattr(resp.state, "name")
-                else str(resp.state),
-                "levels_completed": resp.levels_completed,
-                "win_levels": resp.win_levels,
-                "action_input": {
-                    "id": resp.action_input.id.name
-                    if hasattr(resp.action_input.id, "name")
-                    else str(resp.action_input.id),
-                    "data": resp.action_input.data,
-                    "reasoning": reasoning
-                    if reasoning
-                    else resp.action_input.reasoning,
+            # One timestamp per step, shared by every event recorded for it
+            timestamp = datetime.now(timezone.utc)
+
+            # Convert FrameDataRaw to JSON-serializable dict. The writer thread
+            # serializes it later, so containers the caller may reuse after
+            # step() returns are copied now.
+            try:
+                action_input = resp.action_input
+                data: dict[str, Any] = {
+                    "game_id": resp.game_id,
+                    "state": resp.state.name,
+                    "levels_completed": resp.levels_completed,
+                    "win_levels": resp.win_levels,
+                    "action_input": {
+                        "id": action_input.id.name,
+                        "data": copy.copy(action_input.data),
+                        "reasoning": copy.copy(
+                            reasoning if reasoning else action_input.reasoning
+                        ),
+                    }
+                    if action_input
+                    else None,
+                    "guid": resp.guid,
+                    "full_reset": resp.full_reset,
+                    "available_actions": list(resp.available_actions),
                 }
-                if resp.action_input
-                else None,
-                "guid": resp.guid,
-                "full_reset": getattr(resp, "full_reset", False),
-                "available_actions": resp.available_actions,
-            }
-            if self.include_frame_data:
-                data["frame"] = [
-                    frame_layer.tolist()
-                    if hasattr(frame_layer, "tolist")
-                    else frame_layer
-                    for frame_layer in resp.frame
-                ]
-
-            self._record(data)
+                if self.include_frame_data:
+                    # Frame layers stay numpy arrays, they are converted when
+                    # serialized; snapshot them since the caller holds the same arrays
+                    data["frame"] = [layer.copy() for layer in resp.frame]
+
+                self._record(data, timestamp=timestamp)
+            except AttributeError as e:
+                self.logger.error(
+                    f"Failed to build recording event: {e}",
+                    exc_info=True,
+                )
+
+            # Make sure finished games are fully on disk
+            if resp.state in (GameState.WIN, GameState.GAME_OVER):
+                self._flush_recording()
 
         # Render frames if renderer is set
-        self._steps += 1
         if self.renderer is not None and resp.frame:
             try:
                 self.renderer(self._steps, resp)
@@ -186,8 +398,13 @@ class EnvironmentWrapper:
         # Update scorecard if manager is available
         if self.scorecard_manager and resp.guid and len(resp.frame) > 0:
             try:
-                # Register guid with scorecard if not already registered
-                self.scorecard_manager.add_game(self.scorecard_id, resp.guid)
+                # Register guid with scorecard if not already registered. add_game
+                # is a no-op until the scorecard exists, so only remember guids
+                # the manager actually recorded.
+                if resp.guid not in self._registered_guids:
+                    self.scorecard_manager.add_game(self.scorecard_id, resp.guid)
+                    if self.scorecard_manager.guids.get(resp.guid) == self.scorecard_id:
+                        self._registered_guids.add(resp.guid)
 
                 # Update scorecard
                 self.scorecard_manager.update_scorecard(
@@ -216,15 +433,19 @@ class EnvironmentWrapper:
         Returns:
             A list of GameAction objects converted from the available_actions
             in the last response. Returns an empty list if no response has
-            been set yet or if available_actions is empty.
+            been set yet or if available_actions is empty. Each call returns
+            a new list, so callers may modify it.
         """
         if self._last_response is None or not self._last_response.available_actions:
             return []
 
-        return [
-            GameAction.from_id(action_id)
-            for action_id in self._last_response.available_actions
-        ]
+        # The conversion is cached until the next response
+        if self._action_space is None:
+            self._action_space = tuple(
+                GameAction.from_id(action_id)
+                for action_id in self._last_response.available_actions
+            )
+        return list(self._action_space)
 
     @property
     def info(self) -> EnvironmentInfo:
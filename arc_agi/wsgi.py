@@ -0,0 +1,15 @@
+"""WSGI entry point for serving the ARC-AGI REST API with a production server.
+
+The Arcade is configured from environment variables (ARC_API_KEY,
+OPERATION_MODE, ENVIRONMENTS_DIR, RECORDINGS_DIR, ...). Scorecards and
+running environments live in process memory, so run a single worker
+process and scale with threads, e.g.:
+
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:8001 arc_agi.wsgi:app
+"""
+
+from .base import Arcade
+from .server import create_app
+
+arcade = Arcade()
+app, api = create_app(arcade)
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """Main entry point for ARC-AGI"""
 
-import random
-
-from arcengine import FrameDataRaw, GameState
+import numpy as np
+from arcengine import FrameDataRaw, GameAction, GameState
 
 import arc_agi
 from arc_agi.rendering import render_frames_terminal
@@ -53,17 +52,27 @@ def main() -> None:
 
     max_steps = 1000
 
+    # Draw all the randomness for the run up front. Actions are picked from a
+    # uniform [0, 1) sample so the draw still works if the action space changes.
+    rng = np.random.default_rng()
+    action_samples = rng.random(max_steps)
+    coordinates = rng.integers(0, 64, size=(max_steps, 2))
+
+    # Resolved once instead of per step; the coordinate dict is reused
+    is_complex = {action: action.is_complex() for action in GameAction}
+    no_data: dict[str, int] = {}
+    coordinate_data = {"x": 0, "y": 0}
+
     for i in range(max_steps):
         # Choose a random action
-        random_action = random.choice(env.action_space)
-        action_data = (
-            {}
-            if random_action.is_complex()
-            else {
-                "x": random.randint(0, 63),
-                "y": random.randint(0, 63),
-            }
-        )
+        action_space = env.action_space
+        random_action = action_space[int(action_samples[i] * len(action_space))]
+        if is_complex[random_action]:
+            coordinate_data["x"] = int(coordinates[i, 0])
+            coordinate_data["y"] = int(coordinates[i, 1])
+            action_data = coordinate_data
+        else:
+            action_data = no_data
         # Perform the action
         obv = env.step(random_action, data=action_data)
 
@@ -1,3 +1,4 @@
+import numpy as np
 from arcengine import (
     ARCBaseGame,
     Camera,
@@ -9,17 +10,23 @@ from arcengine import (
 # Create sprites dictionary with all sprite definitions
 sprites = {
     "bad": Sprite(
-        pixels=[
-            [8],
-        ],
+        pixels=np.array(
+            [
+                [8],
+            ],
+            dtype=np.int8,
+        ),
         name="bad",
         visible=True,
         collidable=True,
     ),
     "good": Sprite(
-        pixels=[
-            [14],
-        ],
+        pixels=np.array(
+            [
+                [14],
+            ],
+            dtype=np.int8,
+        ),
         name="good",
         visible=True,
         collidable=True,
@@ -64,6 +71,7 @@ class Bt11(ARCBaseGame):
     _won: bool = True
     _depth: int = 0
     _position: int = 0
+    _depth_limit: int = 0
 
     def __init__(self) -> None:
         # Create camera
@@ -97,7 +105,7 @@ class Bt11(ARCBaseGame):
             self._won = False
             self._depth += 1
 
-        if self._depth >= self.camera.width // 2:
+        if self._depth >= self._depth_limit:
             if self._won:
                 self.next_level()
             else:
@@ -106,6 +114,8 @@ class Bt11(ARCBaseGame):
         self.complete_action()
 
     def on_set_level(self, level: Level) -> None:
+        # The camera is resized per level, so its geometry only changes here
+        self._depth_limit = self.camera.width // 2
         self._won = True
         self._depth = 0
-        self._position = self.camera.width // 2 - 1
+        self._position = self._depth_limit - 1
@@ -1,3 +1,4 @@
+import numpy as np
 from arcengine import (
     ARCBaseGame,
     Camera,
@@ -9,38 +10,50 @@ from arcengine import (
 # Create sprites dictionary with all sprite definitions
 sprites = {
     "bad": Sprite(
-        pixels=[
-            [8],
-        ],
+        pixels=np.array(
+            [
+                [8],
+            ],
+            dtype=np.int8,
+        ),
         name="bad",
         visible=True,
         collidable=True,
         scale=1,
     ),
     "good": Sprite(
-        pixels=[
-            [14],
-        ],
+        pixels=np.array(
+            [
+                [14],
+            ],
+            dtype=np.int8,
+        ),
         name="good",
         visible=True,
         collidable=True,
         scale=1,
     ),
     "left": Sprite(
-        pixels=[
-            [14, 14],
-            [14, -1],
-        ],
+        pixels=np.array(
+            [
+                [14, 14],
+                [14, -1],
+            ],
+            dtype=np.int8,
+        ),
         name="left",
         visible=True,
         collidable=True,
         tags=["sys_click"],
     ),
     "right": Sprite(
-        pixels=[
-            [8, 8],
-            [-1, 8],
-        ],
+        pixels=np.array(
+            [
+                [8, 8],
+                [-1, 8],
+            ],
+            dtype=np.int8,
+        ),
         name="right",
         visible=True,
         collidable=True,
@@ -86,6 +99,7 @@ class Bt33(ARCBaseGame):
     _won: bool = True
     _depth: int = 0
     _placement: int = 0
+    _depth_limit: int = 0
 
     def __init__(self) -> None:
         # Create camera
@@ -131,7 +145,7 @@ class Bt33(ARCBaseGame):
                     self._won = False
                     self._depth += 1
 
-        if self._depth >= self.camera.width // 2:
+        if self._depth >= self._depth_limit:
             if self._won:
                 self.next_level()
             else:
@@ -140,27 +154,16 @@ class Bt33(ARCBaseGame):
         self.complete_action()
 
     def on_set_level(self, level: Level) -> None:
+        # The camera is resized per level, so its geometry only changes here
+        width = self.camera.width
+        self._depth_limit = width // 2
         self._depth = 0
-        self._placement = self.camera.width // 2 - 1
+        self._placement = self._depth_limit - 1
         self._won = True
-        scale = self._current_level_index
-        if scale == 0:
-            self.current_level.add_sprite(
-                sprites["left"].clone().set_position(0, 0).set_scale(1)
-            )
-            self.current_level.add_sprite(
-                sprites["right"]
-                .clone()
-                .set_position(self.camera.width - 2, 0)
-                .set_scale(1)
-            )
-        else:
-            self.current_level.add_sprite(
-                sprites["left"].clone().set_position(0, 0).set_scale(scale)
-            )
-            self.current_level.add_sprite(
-                sprites["right"]
-                .clone()
-                .set_position(self.camera.width - (2 * scale), 0)
-                .set_scale(scale)
-            )
+        scale = max(self._current_level_index, 1)
+        self.current_level.add_sprite(
+            sprites["left"].clone().set_position(0, 0).set_scale(scale)
+        )
+        self.current_level.add_sprite(
+            sprites["right"].clone().set_position(width - 2 * scale, 0).set_scale(scale)
+        )
@@ -1,24 +1,34 @@
 """Tests for ARC-AGI"""
 
-from .test_base import (
-    TestARCAGI3BooleanParsing,
+import sys
+import types
+
+# Replace dotenv before any test module imports arc_agi, so a local .env file
+# cannot change the settings the tests expect. Flask's app.run() also calls
+# find_dotenv and dotenv_values.
+_stub_dotenv = types.ModuleType("dotenv")
+_stub_dotenv.load_dotenv = lambda *args, **kwargs: False
+_stub_dotenv.find_dotenv = lambda *args, **kwargs: ""
+_stub_dotenv.dotenv_values = lambda *args, **kwargs: {}
+sys.modules["dotenv"] = _stub_dotenv
+
+from .test_base import (  # noqa: E402
     TestARCAGI3Defaults,
     TestARCAGI3EdgeCases,
     TestARCAGI3EnvironmentVariables,
 )
-from .test_listen_and_serve import TestListenAndServe
-from .test_local_wrapper import TestLocalEnvironmentWrapper
-from .test_models import TestEnvironmentInfo
-from .test_scorecard import (
+from .test_listen_and_serve import TestListenAndServe  # noqa: E402
+from .test_local_wrapper import TestLocalEnvironmentWrapper  # noqa: E402
+from .test_models import TestEnvironmentInfo  # noqa: E402
+from .test_scorecard import (  # noqa: E402
     TestEnvironmentScore,
     TestEnvironmentScorecard,
-    TestScorecard,
 )
+from .test_scorecard_offline import TestScorecard  # noqa: E402
 
 __all__ = [
     "TestARCAGI3Defaults",
     "TestARCAGI3EnvironmentVariables",
-    "TestARCAGI3BooleanParsing",
     "TestARCAGI3EdgeCases",
     "TestEnvironmentInfo",
     "TestLocalEnvironmentWrapper",
@@ -1,46 +1,79 @@
 """Tests for the ARCAGI3 base class using unittest."""
 
+import io
+import json as _json
 import logging
 import os
-import sys
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlsplit
 
-import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3 import HTTPResponse
 
-# Create a mock dotenv module before any imports
-_mock_dotenv = MagicMock()
-_mock_dotenv.load_dotenv = MagicMock()
-sys.modules["dotenv"] = _mock_dotenv
+from arc_agi import Arcade, OperationMode, base
 
-# Now import arcagi3 - the mock will be used instead of real dotenv
-from arc_agi import Arcade, OperationMode  # noqa: E402
+# Every test runs against an environment holding only ARC_API_KEY; patch.dict
+# restores the caller's environment in one swap when the test returns.
+_isolated_env = patch.dict(os.environ, {"ARC_API_KEY": "test-key-123"}, clear=True)
 
 
-class TestARCAGI3Defaults(unittest.TestCase):
-    """Test ARCAGI3 with default values."""
+# metadata.json contents: game_id, title, one tag and one baseline action count
+_METADATA_TEMPLATE = (
+    b'{"game_id": "%s", "title": "%s", "tags": ["%s"], "baseline_actions": [%d]}'
+)
 
-    def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OPERATION_MODE",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
 
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
+def _write_metadata(env_dir: Path, metadata: bytes) -> None:
+    """Create env_dir and write metadata as its metadata.json."""
+    env_dir.mkdir(parents=True)
+    (env_dir / "metadata.json").write_bytes(metadata)
+
+
+class _RecordingAdapter(HTTPAdapter):
+    """Transport adapter that records requests and answers them in-process.
+
+    Responses are keyed by URL path; unknown paths get a 404.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self._responses = {}
+
+    def reset(self):
+        self.calls.clear()
+        self._responses.clear()
+
+    def set_response(self, path, json=None, body=None, status=200):
+        if body is None:
+            body = b"" if json is None else _json.dumps(json).encode()
+        self._responses[path] = (status, body)
+
+    def set_error(self, path, error):
+        self._responses[path] = error
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        answer = self._responses.get(urlsplit(request.url).path, (404, b""))
+        if isinstance(answer, Exception):
+            raise answer
+        status, body = answer
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+@_isolated_env
+class TestARCAGI3Defaults(unittest.TestCase):
+    """Test ARCAGI3 with default values."""
 
     def test_default_initialization(self):
         """Test that default values are used when no parameters are provided."""
@@ -75,6 +108,15 @@ class TestARCAGI3Defaults(unittest.TestCase):
         stdout_handlers = [h for h in handlers if isinstance(h, logging.StreamHandler)]
         self.assertGreater(len(stdout_handlers), 0)
 
+    def test_default_logger_reused(self):
+        """Test that constructing Arcade again does not replace the default handler."""
+        first = Arcade()
+        handlers = list(first.logger.handlers)
+        second = Arcade()
+
+        self.assertIs(second.logger, first.logger)
+        self.assertEqual(second.logger.handlers, handlers)
+
     def test_custom_logger_used(self):
         """Test that a custom logger is used when provided."""
         custom_logger = logging.getLogger("custom_test_logger")
@@ -86,43 +128,22 @@ class TestARCAGI3Defaults(unittest.TestCase):
         self.assertEqual(client.logger.level, logging.DEBUG)
 
 
+@_isolated_env
 class TestARCAGI3EnvironmentVariables(unittest.TestCase):
     """Test ARCAGI3 with environment variable overrides."""
 
-    def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OPERATION_MODE",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
+    @patch.dict(os.environ, {"ARC_API_KEY": "env-key-456"})
     def test_arc_api_key_from_env(self):
         """Test that constructor argument overrides environment variable."""
-        os.environ["ARC_API_KEY"] = "env-key-456"
         client = Arcade(
             operation_mode=OperationMode.OFFLINE, arc_api_key="constructor-key"
         )
 
         self.assertEqual(client.arc_api_key, "constructor-key")
 
+    @patch.dict(os.environ, {"ARC_BASE_URL": "https://env.example.com"})
     def test_arc_base_url_from_env(self):
         """Test that constructor argument overrides environment variable."""
-        os.environ["ARC_BASE_URL"] = "https://env.example.com"
         client = Arcade(
             operation_mode=OperationMode.OFFLINE,
             arc_base_url="https://constructor.example.com",
@@ -130,108 +151,69 @@ class TestARCAGI3EnvironmentVariables(unittest.TestCase):
 
         self.assertEqual(client.arc_base_url, "https://constructor.example.com")
 
-    def test_operation_mode_from_constructor_overrides_env(self):
-        """Test that constructor argument overrides OPERATION_MODE env var."""
-        os.environ["OPERATION_MODE"] = "normal"
-        client = Arcade(operation_mode=OperationMode.OFFLINE)
-
-        self.assertEqual(client.operation_mode, OperationMode.OFFLINE)
-
-    def test_operation_mode_from_env_when_normal_passed(self):
-        """Test that when NORMAL is passed (default), env var is still checked."""
-        os.environ["OPERATION_MODE"] = "offline"
-        client = Arcade(operation_mode=OperationMode.NORMAL)
-
-        self.assertEqual(client.operation_mode, OperationMode.OFFLINE)
-
-    def test_operation_mode_online_from_constructor_overrides_env(self):
-        """Test that constructor ONLINE overrides env var."""
-        os.environ["OPERATION_MODE"] = "normal"
-        client = Arcade(operation_mode=OperationMode.ONLINE)
-
-        self.assertEqual(client.operation_mode, OperationMode.ONLINE)
-
-    def test_operation_mode_from_env_when_default(self):
-        """Test that OPERATION_MODE env is used when default NORMAL is used."""
-        os.environ["OPERATION_MODE"] = "online"
-        client = Arcade()
-
-        self.assertEqual(client.operation_mode, OperationMode.ONLINE)
-
-    def test_operation_mode_competition(self):
-        """Test that constructor ONLINE overrides env var."""
-        os.environ["OPERATION_MODE"] = "competition"
-        client = Arcade()
-
-        self.assertEqual(client.operation_mode, OperationMode.COMPETITION)
-
-    def test_operation_mode_competition_from_env_overrides_constructor(self):
-        """Test that constructor ONLINE overrides env var."""
-        os.environ["OPERATION_MODE"] = "competition"
-        client = Arcade(operation_mode=OperationMode.ONLINE)
-
-        self.assertEqual(client.operation_mode, OperationMode.COMPETITION)
-
-
-class TestARCAGI3BooleanParsing(unittest.TestCase):
-    """Test boolean/enum parsing from environment variables."""
-
-    def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = [
-            "OPERATION_MODE",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
+    def test_operation_mode_resolution(self):
+        """Test how the operation mode is resolved from env vars and the constructor."""
+        cases = [
+            (
+                "constructor overrides env",
+                {"OPERATION_MODE": "normal"},
+                {"operation_mode": OperationMode.OFFLINE},
+                OperationMode.OFFLINE,
+            ),
+            (
+                "env checked when NORMAL passed",
+                {"OPERATION_MODE": "offline"},
+                {"operation_mode": OperationMode.NORMAL},
+                OperationMode.OFFLINE,
+            ),
+            (
+                "constructor ONLINE overrides env",
+                {"OPERATION_MODE": "normal"},
+                {"operation_mode": OperationMode.ONLINE},
+                OperationMode.ONLINE,
+            ),
+            (
+                "env used with default",
+                {"OPERATION_MODE": "online"},
+                {},
+                OperationMode.ONLINE,
+            ),
+            (
+                "competition from env",
+                {"OPERATION_MODE": "competition"},
+                {},
+                OperationMode.COMPETITION,
+            ),
+            (
+                "competition from env overrides constructor",
+                {"OPERATION_MODE": "competition"},
+                {"operation_mode": OperationMode.ONLINE},
+                OperationMode.COMPETITION,
+            ),
+            (
+                "OFFLINE_ONLY=false yields NORMAL",
+                {"OFFLINE_ONLY": "false"},
+                {},
+                OperationMode.NORMAL,
+            ),
+            (
+                "ONLINE_ONLY=false yields NORMAL",
+                {"ONLINE_ONLY": "false"},
+                {},
+                OperationMode.NORMAL,
+            ),
         ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def test_operation_mode_env_normal_when_offline_false(self):
-        """Test that OFFLINE_ONLY=false yields NORMAL when no other env set."""
-        os.environ["OFFLINE_ONLY"] = "false"
-        client = Arcade()
-        self.assertEqual(client.operation_mode, OperationMode.NORMAL)
+        for name, env, kwargs, expected in cases:
+            with self.subTest(name), patch.dict(os.environ, env):
+                client = Arcade(**kwargs)
 
-    def test_operation_mode_env_online_false_yields_normal(self):
-        """Test that ONLINE_ONLY=false with no OPERATION_MODE yields NORMAL."""
-        os.environ["ONLINE_ONLY"] = "false"
-        client = Arcade()
-        self.assertEqual(client.operation_mode, OperationMode.NORMAL)
+                self.assertEqual(client.operation_mode, expected)
 
 
+@_isolated_env
 class TestARCAGI3EdgeCases(unittest.TestCase):
     """Test edge cases and special scenarios."""
 
-    def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OPERATION_MODE",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
     def test_empty_string_api_key(self):
         """Test that empty string API key is handled correctly."""
         client = Arcade(arc_api_key="")
@@ -250,12 +232,16 @@ class TestARCAGI3EdgeCases(unittest.TestCase):
         self.assertEqual(client.arc_base_url, "https://constructor.url")
         self.assertEqual(client.operation_mode, OperationMode.ONLINE)
 
+    @patch.dict(
+        os.environ,
+        {
+            "ARC_API_KEY": "env-api-key",
+            "ARC_BASE_URL": "https://env.url",
+            "OPERATION_MODE": "online",
+        },
+    )
     def test_all_env_vars_set(self):
         """Test that all environment variables can be set simultaneously."""
-        os.environ["ARC_API_KEY"] = "env-api-key"
-        os.environ["ARC_BASE_URL"] = "https://env.url"
-        os.environ["OPERATION_MODE"] = "online"
-
         client = Arcade()
 
         self.assertEqual(client.arc_api_key, "env-api-key")
@@ -263,64 +249,79 @@ class TestARCAGI3EdgeCases(unittest.TestCase):
         self.assertEqual(client.operation_mode, OperationMode.ONLINE)
 
 
+@_isolated_env
 class TestARCAGI3EnvironmentsDirScanning(unittest.TestCase):
     """Test environments_dir scanning functionality."""
 
-    def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = ["ENVIRONMENTS_DIR"]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only environment trees shared by the tests once."""
+        tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmpdir.cleanup)
+        root = Path(tmpdir.name)
+
+        # Two valid environments, one nested, plus an invalid file to skip
+        cls.scan_dir = root / "scan"
+        _write_metadata(
+            cls.scan_dir / "env1",
+            _METADATA_TEMPLATE % (b"test1", b"Test1", b"tag1", 10),
+        )
+        _write_metadata(
+            cls.scan_dir / "env2" / "subdir",
+            _METADATA_TEMPLATE % (b"test2", b"Test2", b"tag2", 20),
+        )
+        _write_metadata(cls.scan_dir / "env3", b"invalid json")
+
+        cls.lookup_dir = root / "lookup"
+        _write_metadata(
+            cls.lookup_dir / "ab12" / "v1", b'{"game_id": "ab12-v1", "title": "AB12"}'
+        )
+
+        cls.env_var_dir = root / "env_var"
+        _write_metadata(
+            cls.env_var_dir / "env1",
+            _METADATA_TEMPLATE % (b"env-test", b"EnvTest", b"tag1", 10),
+        )
+
+        cls.empty_dir = root / "empty"
+        cls.empty_dir.mkdir()
 
     def test_environments_dir_scanning(self):
         """Test that environments_dir scanning finds metadata.json files."""
-        import tempfile
-        from pathlib import Path
-
-        # Create a temporary directory structure
-        with tempfile.TemporaryDirectory() as tmpdir:
-            environments_dir = Path(tmpdir) / "environments"
-            environments_dir.mkdir()
-
-            # Create environment1 with metadata.json
-            env1_dir = environments_dir / "env1"
-            env1_dir.mkdir()
-            metadata1 = env1_dir / "metadata.json"
-            metadata1.write_text(
-                '{"game_id": "test1", "title": "Test1", "tags": ["tag1"], "baseline_actions": [10]}',
-                encoding="utf-8",
-            )
+        client = Arcade(environments_dir=str(self.scan_dir))
+
+        # Should have found 2 valid environments
+        self.assertEqual(len(client.available_environments), 2)
+        # Check that both environments were found (order may vary)
+        environment_ids = {env.game_id for env in client.available_environments}
+        self.assertEqual(environment_ids, {"test1", "test2"})
 
-            # Create environment2 in subdirectory
-            env2_dir = environments_dir / "env2" / "subdir"
-            env2_dir.mkdir(parents=True)
-            metadata2 = env2_dir / "metadata.json"
-            metadata2.write_text(
-                '{"game_id": "test2", "title": "Test2", "tags": ["tag2"], "baseline_actions": [20]}',
-                encoding="utf-8",
+    def test_environments_dir_scanned_on_first_use(self):
+        """Test that OFFLINE construction defers scanning until environments are used."""
+        with patch.object(Arcade, "_scan_for_environments", autospec=True) as mock_scan:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=str(self.scan_dir),
             )
+            mock_scan.assert_not_called()
 
-            # Create invalid metadata file (should be skipped)
-            env3_dir = environments_dir / "env3"
-            env3_dir.mkdir()
-            metadata3 = env3_dir / "metadata.json"
-            metadata3.write_text("invalid json", encoding="utf-8")
+            client.get_environments()
+            client.get_environment("test1")
+            mock_scan.assert_called_once_with(client)
 
-            # Initialize ARCAGI3 with environments_dir
-            client = Arcade(environments_dir=str(environments_dir))
+    def test_get_environment_by_id(self):
+        """Test that environments can be looked up by full or base game_id."""
+        client = Arcade(
+            operation_mode=OperationMode.OFFLINE,
+            environments_dir=str(self.lookup_dir),
+        )
 
-            # Should have found 2 valid environments
-            self.assertEqual(len(client.available_environments), 2)
-            # Check that both environments were found (order may vary)
-            environment_ids = {env.game_id for env in client.available_environments}
-            self.assertEqual(environment_ids, {"test1", "test2"})
+        env = client.get_environment("ab12-v1")
+        self.assertIsNotNone(env)
+        self.assertEqual(env.title, "AB12")
+        self.assertIs(client.get_environment("ab12"), env)
+        self.assertIsNone(client.get_environment("ab12-v2"))
+        self.assertIsNone(client.get_environment("zz99"))
 
     def test_environments_dir_none(self):
         """Test that environments_dir can be explicitly set to None."""
@@ -344,49 +345,22 @@ class TestARCAGI3EnvironmentsDirScanning(unittest.TestCase):
 
     def test_environments_dir_from_env(self):
         """Test that environments_dir can be set from environment variable when constructor uses default."""
-        import tempfile
-        from pathlib import Path
-
-        # Create a temporary directory with metadata
-        with tempfile.TemporaryDirectory() as tmpdir:
-            environments_dir = Path(tmpdir) / "environments"
-            environments_dir.mkdir()
-            env_dir = environments_dir / "env1"
-            env_dir.mkdir()
-            metadata = env_dir / "metadata.json"
-            metadata.write_text(
-                '{"game_id": "env-test", "title": "EnvTest", "tags": ["tag1"], "baseline_actions": [10]}',
-                encoding="utf-8",
-            )
+        with patch.dict(os.environ, {"ENVIRONMENTS_DIR": str(self.env_var_dir)}):
+            # No constructor arg, should use env var
+            client = Arcade()
 
-            os.environ["ENVIRONMENTS_DIR"] = str(environments_dir)
-            try:
-                # No constructor arg, should use env var
-                client = Arcade()
-
-                self.assertEqual(client.environments_dir, str(environments_dir))
-                self.assertEqual(len(client.available_environments), 1)
-                self.assertEqual(client.available_environments[0].game_id, "env-test")
-            finally:
-                os.environ.pop("ENVIRONMENTS_DIR", None)
+            self.assertEqual(client.environments_dir, str(self.env_var_dir))
+            self.assertEqual(len(client.available_environments), 1)
+            self.assertEqual(client.available_environments[0].game_id, "env-test")
 
     def test_environments_dir_empty_directory(self):
         """Test that empty environments_dir results in no environments."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            environments_dir = Path(tmpdir) / "environments"
-            environments_dir.mkdir()
-
-            client = Arcade(environments_dir=str(environments_dir))
+        client = Arcade(environments_dir=str(self.empty_dir))
 
-            self.assertEqual(len(client.available_environments), 0)
+        self.assertEqual(len(client.available_environments), 0)
 
     def test_environments_dir_with_test_files(self):
         """Test scanning the test_environment_files directory."""
-        from pathlib import Path
-
         test_environments_dir = Path(__file__).parent.parent / "test_environment_files"
         if test_environments_dir.exists():
             client = Arcade(environments_dir=str(test_environments_dir))
@@ -399,43 +373,54 @@ class TestARCAGI3EnvironmentsDirScanning(unittest.TestCase):
             self.assertIn("tg62-12345678", environment_ids)
 
 
+@_isolated_env
 class TestARCAGI3APIFetching(unittest.TestCase):
     """Test API fetching functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the local environment trees merged with API results once."""
+        tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmpdir.cleanup)
+        root = Path(tmpdir.name)
+
+        cls.local_dir = root / "local"
+        _write_metadata(
+            cls.local_dir / "env1",
+            _METADATA_TEMPLATE % (b"local-game-1", b"Local Game 1", b"local-tag", 5),
+        )
+
+        cls.duplicate_dir = root / "duplicate"
+        _write_metadata(
+            cls.duplicate_dir / "env1",
+            _METADATA_TEMPLATE % (b"duplicate-game", b"Local Version", b"local-tag", 5),
+        )
+
+        # Route every https request made through arc_agi.base._session to the
+        # recorder for the lifetime of this class.
+        cls.adapter = _RecordingAdapter()
+        original = base._session.get_adapter("https://")
+        base._session.mount("https://", cls.adapter)
+        cls.addClassCleanup(base._session.mount, "https://", original)
+
     def setUp(self):
-        """Clear environment variables before each test."""
-        self.env_vars_to_clear = [
-            "ENVIRONMENTS_DIR",
-            "OPERATION_MODE",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "ARC_API_KEY",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up environment variables after each test."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_fetch_when_not_offline(self, mock_get):
+        """Start each test with no canned responses and no recorded calls."""
+        self.adapter.reset()
+
+    def test_api_fetch_when_not_offline(self):
         """Test that API is called when not in OFFLINE mode."""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "game_id": "api-game-1",
-                "title": "API Game 1",
-                "tags": ["api-tag"],
-                "baseline_actions": [10, 20],
-            }
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        self.adapter.set_response(
+            "/api/games",
+            json=[
+                {
+                    "game_id": "api-game-1",
+                    "title": "API Game 1",
+                    "tags": ["api-tag"],
+                    "baseline_actions": [10, 20],
+                }
+            ],
+        )
 
         client = Arcade(
             arc_api_key="test-api-key",
@@ -444,17 +429,16 @@ class TestARCAGI3APIFetching(unittest.TestCase):
         )
 
         # Verify API was called
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        self.assertEqual(call_args[0][0], "https://three.arcprize.org/api/games")
-        self.assertEqual(call_args[1]["headers"]["X-API-Key"], "test-api-key")
+        self.assertEqual(len(self.adapter.calls), 1)
+        request = self.adapter.calls[0]
+        self.assertEqual(request.url, "https://three.arcprize.org/api/games")
+        self.assertEqual(request.headers["X-API-Key"], "test-api-key")
 
         # Verify environment was added
         self.assertEqual(len(client.available_environments), 1)
         self.assertEqual(client.available_environments[0].game_id, "api-game-1")
 
-    @patch("arc_agi.base.requests.get")
-    def test_api_not_fetched_when_offline(self, mock_get):
+    def test_api_not_fetched_when_offline(self):
         """Test that API is not called when in OFFLINE mode."""
         _ = Arcade(
             arc_api_key="test-api-key",
@@ -463,165 +447,109 @@ class TestARCAGI3APIFetching(unittest.TestCase):
         )
 
         # Verify API was not called
-        mock_get.assert_not_called()
+        self.assertEqual(self.adapter.calls, [])
 
-    @patch("arc_agi.base.requests.get")
-    def test_api_merge_with_local_environments(self, mock_get):
+    def test_api_merge_with_local_environments(self):
         """Test that API environments are merged with local environments."""
-        import tempfile
-        from pathlib import Path
-
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "game_id": "api-game-1",
-                "title": "API Game 1",
-                "tags": ["api-tag"],
-                "baseline_actions": [10],
-            }
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
-
-        # Create local environment with different game_id
-        with tempfile.TemporaryDirectory() as tmpdir:
-            environments_dir = Path(tmpdir) / "environments"
-            environments_dir.mkdir()
-            env_dir = environments_dir / "env1"
-            env_dir.mkdir()
-            metadata = env_dir / "metadata.json"
-            metadata.write_text(
-                '{"game_id": "local-game-1", "title": "Local Game 1", "tags": ["local-tag"], "baseline_actions": [5]}',
-                encoding="utf-8",
-            )
-
-            client = Arcade(
-                arc_api_key="test-api-key",
-                operation_mode=OperationMode.NORMAL,
-                environments_dir=str(environments_dir),
-            )
-
-            # Should have both local and API environments
-            self.assertEqual(len(client.available_environments), 2)
-            game_ids = {env.game_id for env in client.available_environments}
-            self.assertEqual(game_ids, {"local-game-1", "api-game-1"})
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_removes_duplicate_game_ids(self, mock_get):
-        """Test that duplicate game_ids from API are not added if they exist locally."""
-        import tempfile
-        from pathlib import Path
-
-        # Mock API response with same game_id as local
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "game_id": "duplicate-game",
-                "title": "API Version",
-                "tags": ["api-tag"],
-                "baseline_actions": [10],
-            }
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
-
-        # Create local environment with same game_id
-        with tempfile.TemporaryDirectory() as tmpdir:
-            environments_dir = Path(tmpdir) / "environments"
-            environments_dir.mkdir()
-            env_dir = environments_dir / "env1"
-            env_dir.mkdir()
-            metadata = env_dir / "metadata.json"
-            metadata.write_text(
-                '{"game_id": "duplicate-game", "title": "Local Version", "tags": ["local-tag"], "baseline_actions": [5]}',
-                encoding="utf-8",
-            )
-
-            client = Arcade(
-                arc_api_key="test-api-key",
-                operation_mode=OperationMode.NORMAL,
-                environments_dir=str(environments_dir),
-            )
-
-            # Should only have one environment (local version, API duplicate ignored)
-            self.assertEqual(len(client.available_environments), 1)
-            self.assertEqual(client.available_environments[0].game_id, "duplicate-game")
-            # Should be the local version (scanned first)
-            self.assertEqual(client.available_environments[0].title, "Local Version")
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_no_key_skips_fetch(self, mock_get):
-        """Test that API is not called when no API key is provided."""
-        _ = Arcade(
-            arc_api_key="",  # Empty API key
-            operation_mode=OperationMode.NORMAL,
-            environments_dir=None,
+        self.adapter.set_response(
+            "/api/games",
+            json=[
+                {
+                    "game_id": "api-game-1",
+                    "title": "API Game 1",
+                    "tags": ["api-tag"],
+                    "baseline_actions": [10],
+                }
+            ],
         )
 
-        # Verify API was not called
-        mock_get.assert_not_called()
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_error_handled_gracefully(self, mock_get):
-        """Test that API errors are handled gracefully."""
-        # Mock API error
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
-
+        # Local environment with different game_id
         client = Arcade(
             arc_api_key="test-api-key",
             operation_mode=OperationMode.NORMAL,
-            environments_dir=None,
+            environments_dir=str(self.local_dir),
         )
 
-        # Should not raise exception, just have no environments
-        self.assertEqual(len(client.available_environments), 0)
+        # Should have both local and API environments
+        self.assertEqual(len(client.available_environments), 2)
+        game_ids = {env.game_id for env in client.available_environments}
+        self.assertEqual(game_ids, {"local-game-1", "api-game-1"})
 
-    @patch("arc_agi.base.requests.get")
-    def test_api_http_error_handled_gracefully(self, mock_get):
-        """Test that HTTP errors are handled gracefully."""
-        # Mock HTTP error response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404 Not Found"
+    def test_api_removes_duplicate_game_ids(self):
+        """Test that duplicate game_ids from API are not added if they exist locally."""
+        # Mock API response with same game_id as local
+        self.adapter.set_response(
+            "/api/games",
+            json=[
+                {
+                    "game_id": "duplicate-game",
+                    "title": "API Version",
+                    "tags": ["api-tag"],
+                    "baseline_actions": [10],
+                }
+            ],
         )
-        mock_get.return_value = mock_response
 
+        # Local environment with same game_id
         client = Arcade(
             arc_api_key="test-api-key",
             operation_mode=OperationMode.NORMAL,
-            environments_dir=None,
+            environments_dir=str(self.duplicate_dir),
         )
 
-        # Should not raise exception, just have no environments
-        self.assertEqual(len(client.available_environments), 0)
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_invalid_response_handled_gracefully(self, mock_get):
-        """Test that invalid API responses are handled gracefully."""
-        # Mock invalid JSON response
-        mock_response = MagicMock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        # Should only have one environment (local version, API duplicate ignored)
+        self.assertEqual(len(client.available_environments), 1)
+        self.assertEqual(client.available_environments[0].game_id, "duplicate-game")
+        # Should be the local version (scanned first)
+        self.assertEqual(client.available_environments[0].title, "Local Version")
 
-        client = Arcade(
-            arc_api_key="test-api-key",
+    def test_api_no_key_skips_fetch(self):
+        """Test that API is not called when no API key is provided."""
+        _ = Arcade(
+            arc_api_key="",  # Empty API key
             operation_mode=OperationMode.NORMAL,
             environments_dir=None,
         )
 
-        # Should not raise exception, just have no environments
-        self.assertEqual(len(client.available_environments), 0)
-
-    @patch("arc_agi.base.requests.get")
-    def test_api_custom_base_url(self, mock_get):
+        # Verify API was not called
+        self.assertEqual(self.adapter.calls, [])
+
+    def test_api_errors_handled_gracefully(self):
+        """Test that network, HTTP and invalid response errors are handled gracefully."""
+        cases = [
+            (
+                "network error",
+                lambda: self.adapter.set_error(
+                    "/api/games", RequestsConnectionError("Network error")
+                ),
+            ),
+            (
+                "http error",
+                lambda: self.adapter.set_response("/api/games", status=404),
+            ),
+            (
+                "invalid json",
+                lambda: self.adapter.set_response("/api/games", body=b"not json"),
+            ),
+        ]
+        for name, configure in cases:
+            with self.subTest(name):
+                self.adapter.reset()
+                configure()
+                client = Arcade(
+                    arc_api_key="test-api-key",
+                    operation_mode=OperationMode.NORMAL,
+                    environments_dir=None,
+                )
+
+                # Should not raise exception, just have no environments
+                self.assertEqual(len(client.available_environments), 0)
+
+    def test_api_custom_base_url(self):
         """Test that API uses custom base_url."""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        self.adapter.set_response("/api/games", json=[])
 
         _ = Arcade(
             arc_api_key="test-api-key",
@@ -631,8 +559,9 @@ class TestARCAGI3APIFetching(unittest.TestCase):
         )
 
         # Verify API was called with custom URL
-        call_args = mock_get.call_args
-        self.assertEqual(call_args[0][0], "https://custom.example.com/api/games")
+        self.assertEqual(
+            self.adapter.calls[-1].url, "https://custom.example.com/api/games"
+        )
 
 
 if __name__ == "__main__":
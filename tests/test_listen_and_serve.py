@@ -3,25 +3,23 @@
 import logging
 import os
 import socket
-import sys
 import threading
 import time
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
+from arcengine import GameAction
 from requests.exceptions import HTTPError
 
-_mock_dotenv = MagicMock()
-_mock_dotenv.load_dotenv = MagicMock()
-sys.modules["dotenv"] = _mock_dotenv
-
-from arcengine import GameAction  # noqa: E402
-
-from arc_agi import (  # noqa: E402
+from arc_agi import (
     Arcade,
     OperationMode,
 )
+from arc_agi.server import create_app
+
+# Passed to Arcade so its INFO messages stay off the default stdout logger
+_LOG = logging.getLogger("test")
 
 
 def _find_free_port() -> int:
@@ -31,78 +29,129 @@ def _find_free_port() -> int:
         return s.getsockname()[1]
 
 
+def _wait_for_port(host: str, port: int, timeout: float = 5.0) -> None:
+    """Poll until something accepts TCP connections on (host, port)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError(f"nothing listening on {host}:{port} after {timeout}s")
+
+
+@patch.dict(os.environ, {"ARC_API_KEY": "test-key-123"}, clear=True)
 class TestListenAndServe(unittest.TestCase):
     """Test listen_and_serve with offline server and online client."""
 
+    shared_base_url: str
+    shared_server_error: list[Exception]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start one offline server shared by tests that need no server options."""
+        test_dir = Path(__file__).parent.parent / "test_environment_files"
+        if not test_dir.exists():
+            return  # the tests skip themselves
+
+        with patch.dict(os.environ, {"ARC_API_KEY": "test-key-123"}, clear=True):
+            server_arc = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=str(test_dir),
+                arc_api_key="test-key-123",
+                logger=_LOG,
+            )
+
+        port = _find_free_port()
+        cls.shared_base_url = f"http://127.0.0.1:{port}"
+        cls.shared_server_error = []
+
+        # The server thread is a daemon and exits with the test process
+        def run_server() -> None:
+            try:
+                server_arc.listen_and_serve(
+                    host="127.0.0.1",
+                    port=port,
+                    use_reloader=False,
+                )
+            except Exception as e:
+                cls.shared_server_error.append(e)
+
+        threading.Thread(target=run_server, daemon=True).start()
+        _wait_for_port("127.0.0.1", port)
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-        self.logger = logging.getLogger("test")
-        self.logger.setLevel(logging.INFO)
-
         test_dir = Path(__file__).parent.parent / "test_environment_files"
         self.environments_dir = str(test_dir)
 
-    def tearDown(self) -> None:
-        """Clean up after tests."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def test_offline_server_online_client_four_action3_levels_completed_one(
-        self,
-    ) -> None:
-        """Spin up Arcade in offline mode with test_environment_files, serve backend,
-        then use online client to play bt11: four ACTION3 steps yield levels_completed=1."""
-        if not Path(self.environments_dir).exists():
-            self.skipTest("test_environment_files not found")
+    def test_healthcheck(self) -> None:
+        """Healthcheck answers plain text okay on every request."""
+        server_arc = Arcade(
+            operation_mode=OperationMode.OFFLINE,
+            environments_dir=self.environments_dir,
+            arc_api_key="test-key-123",
+            logger=_LOG,
+        )
+        app, _ = create_app(server_arc)
+        client = app.test_client()
 
-        port = _find_free_port()
-        base_url = f"http://127.0.0.1:{port}"
+        for _ in range(2):
+            response = client.get("/api/healthcheck")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, b"okay")
+            self.assertEqual(response.headers["Content-Type"], "text/plain")
 
-        # Server: offline Arcade with test_environment_files
+    def test_json_responses_are_compact(self) -> None:
+        """JSON responses keep insertion order and carry no whitespace."""
         server_arc = Arcade(
             operation_mode=OperationMode.OFFLINE,
             environments_dir=self.environments_dir,
             arc_api_key="test-key-123",
-            logger=self.logger,
+            logger=_LOG,
         )
-        self.assertGreater(
-            len(server_arc.available_environments),
-            0,
-            "Server should have at least one environment from test_environment_files",
+        app, _ = create_app(server_arc)
+        app.debug = True
+        client = app.test_client()
+
+        response = client.get("/api/games")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(b"\n", response.data.strip())
+        self.assertNotIn(b": ", response.data)
+        self.assertTrue(response.data.startswith(b'[{"game_id":'))
+
+    def test_cmd_route_dispatches_by_action_name(self) -> None:
+        """Known actions reach RestAPI.cmd, unknown ones get a 404."""
+        server_arc = Arcade(
+            operation_mode=OperationMode.OFFLINE,
+            environments_dir=self.environments_dir,
+            arc_api_key="test-key-123",
+            logger=_LOG,
         )
+        app, _ = create_app(server_arc)
+        client = app.test_client()
 
-        # Run server in background thread (blocking listen_and_serve)
-        server_error: list[Exception] = []
+        response = client.post("/api/cmd/ACTION1", json={})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("game_id", response.get_json()["message"])
 
-        def run_server() -> None:
-            try:
-                server_arc.listen_and_serve(
-                    host="127.0.0.1",
-                    port=port,
-                    use_reloader=False,
-                )
-            except Exception as e:
-                server_error.append(e)
+        response = client.post("/api/cmd/ACTION9", json={})
+        self.assertEqual(response.status_code, 404)
 
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
+        response = client.get("/api/cmd/RESET")
+        self.assertEqual(response.status_code, 405)
 
-        # Give server time to bind
-        time.sleep(1.5)
+    def test_offline_server_online_client_four_action3_levels_completed_one(
+        self,
+    ) -> None:
+        """Spin up Arcade in offline mode with test_environment_files, serve backend,
+        then use online client to play bt11: four ACTION3 steps yield levels_completed=1."""
+        if not Path(self.environments_dir).exists():
+            self.skipTest("test_environment_files not found")
+
+        base_url = self.shared_base_url
+        server_error = self.shared_server_error
 
         try:
             # Client: online Arcade pointing at localhost
@@ -110,7 +159,7 @@ class TestListenAndServe(unittest.TestCase):
                 operation_mode=OperationMode.ONLINE,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             # Open scorecard on server (POST /api/scorecard/open)
@@ -160,44 +209,15 @@ class TestListenAndServe(unittest.TestCase):
         if not Path(self.environments_dir).exists():
             self.skipTest("test_environment_files not found")
 
-        port = _find_free_port()
-        base_url = f"http://127.0.0.1:{port}"
-
-        server_arc = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            arc_api_key="test-key-123",
-            logger=self.logger,
-        )
-        self.assertGreater(
-            len(server_arc.available_environments),
-            0,
-            "Server should have at least one environment from test_environment_files",
-        )
-
-        server_error: list[Exception] = []
-
-        def run_server() -> None:
-            try:
-                server_arc.listen_and_serve(
-                    host="127.0.0.1",
-                    port=port,
-                    use_reloader=False,
-                )
-            except Exception as e:
-                server_error.append(e)
-
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-
-        time.sleep(1.5)
+        base_url = self.shared_base_url
+        server_error = self.shared_server_error
 
         try:
             client_arc = Arcade(
                 operation_mode=OperationMode.COMPETITION,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             card_id_1 = client_arc.create_scorecard()
@@ -222,7 +242,7 @@ class TestListenAndServe(unittest.TestCase):
             operation_mode=OperationMode.OFFLINE,
             environments_dir=self.environments_dir,
             arc_api_key="test-key-123",
-            logger=self.logger,
+            logger=_LOG,
         )
         self.assertGreater(
             len(server_arc.available_environments),
@@ -246,14 +266,14 @@ class TestListenAndServe(unittest.TestCase):
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
 
-        time.sleep(1.5)
+        _wait_for_port("127.0.0.1", port)
 
         try:
             client_arc = Arcade(
                 operation_mode=OperationMode.COMPETITION,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             card_id_1 = client_arc.create_scorecard()
@@ -271,44 +291,15 @@ class TestListenAndServe(unittest.TestCase):
         if not Path(self.environments_dir).exists():
             self.skipTest("test_environment_files not found")
 
-        port = _find_free_port()
-        base_url = f"http://127.0.0.1:{port}"
-
-        server_arc = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            arc_api_key="test-key-123",
-            logger=self.logger,
-        )
-        self.assertGreater(
-            len(server_arc.available_environments),
-            0,
-            "Server should have at least one environment from test_environment_files",
-        )
-
-        server_error: list[Exception] = []
-
-        def run_server() -> None:
-            try:
-                server_arc.listen_and_serve(
-                    host="127.0.0.1",
-                    port=port,
-                    use_reloader=False,
-                )
-            except Exception as e:
-                server_error.append(e)
-
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-
-        time.sleep(1.5)
+        base_url = self.shared_base_url
+        server_error = self.shared_server_error
 
         try:
             client_arc = Arcade(
                 operation_mode=OperationMode.COMPETITION,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             card_id = client_arc.create_scorecard()
@@ -338,7 +329,7 @@ class TestListenAndServe(unittest.TestCase):
             operation_mode=OperationMode.OFFLINE,
             environments_dir=self.environments_dir,
             arc_api_key="test-key-123",
-            logger=self.logger,
+            logger=_LOG,
         )
         self.assertGreater(
             len(server_arc.available_environments),
@@ -362,14 +353,14 @@ class TestListenAndServe(unittest.TestCase):
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
 
-        time.sleep(1.5)
+        _wait_for_port("127.0.0.1", port)
 
         try:
             client_arc = Arcade(
                 operation_mode=OperationMode.ONLINE,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             card_id = client_arc.create_scorecard()
@@ -405,44 +396,15 @@ class TestListenAndServe(unittest.TestCase):
         if not Path(self.environments_dir).exists():
             self.skipTest("test_environment_files not found")
 
-        port = _find_free_port()
-        base_url = f"http://127.0.0.1:{port}"
-
-        server_arc = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            arc_api_key="test-key-123",
-            logger=self.logger,
-        )
-        self.assertGreater(
-            len(server_arc.available_environments),
-            0,
-            "Server should have at least one environment from test_environment_files",
-        )
-
-        server_error: list[Exception] = []
-
-        def run_server() -> None:
-            try:
-                server_arc.listen_and_serve(
-                    host="127.0.0.1",
-                    port=port,
-                    use_reloader=False,
-                )
-            except Exception as e:
-                server_error.append(e)
-
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-
-        time.sleep(1.5)
+        base_url = self.shared_base_url
+        server_error = self.shared_server_error
 
         try:
             client_arc_normal = Arcade(
                 operation_mode=OperationMode.ONLINE,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             normal_card_id = client_arc_normal.create_scorecard()
@@ -468,7 +430,7 @@ class TestListenAndServe(unittest.TestCase):
                 operation_mode=OperationMode.COMPETITION,
                 arc_base_url=base_url,
                 arc_api_key="test-key-987",
-                logger=self.logger,
+                logger=_LOG,
             )
             comp_card_id = client_arc_comp.create_scorecard()
             self.assertIsNotNone(comp_card_id, "Should get card_id from server")
@@ -498,44 +460,15 @@ class TestListenAndServe(unittest.TestCase):
         if not Path(self.environments_dir).exists():
             self.skipTest("test_environment_files not found")
 
-        port = _find_free_port()
-        base_url = f"http://127.0.0.1:{port}"
-
-        server_arc = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            arc_api_key="test-key-123",
-            logger=self.logger,
-        )
-        self.assertGreater(
-            len(server_arc.available_environments),
-            0,
-            "Server should have at least one environment from test_environment_files",
-        )
-
-        server_error: list[Exception] = []
-
-        def run_server() -> None:
-            try:
-                server_arc.listen_and_serve(
-                    host="127.0.0.1",
-                    port=port,
-                    use_reloader=False,
-                )
-            except Exception as e:
-                server_error.append(e)
-
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-
-        time.sleep(1.5)
+        base_url = self.shared_base_url
+        server_error = self.shared_server_error
 
         try:
             client_arc_normal = Arcade(
                 operation_mode=OperationMode.ONLINE,
                 arc_base_url=base_url,
                 arc_api_key="test-key-123",
-                logger=self.logger,
+                logger=_LOG,
             )
 
             normal_card_id = client_arc_normal.create_scorecard()
@@ -578,7 +511,7 @@ class TestListenAndServe(unittest.TestCase):
                 operation_mode=OperationMode.COMPETITION,
                 arc_base_url=base_url,
                 arc_api_key="test-key-987",
-                logger=self.logger,
+                logger=_LOG,
             )
             comp_card_id = client_arc_comp.create_scorecard()
             self.assertIsNotNone(comp_card_id, "Should get card_id from server")
@@ -1,94 +1,78 @@
 """Tests for LocalEnvironmentWrapper using unittest."""
 
+import json
 import logging
 import os
-import sys
+import tempfile
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
-_mock_dotenv = MagicMock()
-_mock_dotenv.load_dotenv = MagicMock()
-sys.modules["dotenv"] = _mock_dotenv
+import numpy as np
+from arcengine import GameAction, GameState
 
-from arcengine import GameAction, GameState  # noqa: E402
+from arc_agi import Arcade, OperationMode
+from arc_agi.wrapper import HAS_ORJSON, _dumps_json, _dumps_orjson
 
-from arc_agi import Arcade, OperationMode  # noqa: E402
+# Passed to Arcade so its INFO messages stay off the default stdout logger
+_LOG = logging.getLogger("test")
 
 
+@patch.dict(os.environ, {"ARC_API_KEY": "test-key-123"}, clear=True)
 class TestLocalEnvironmentWrapper(unittest.TestCase):
     """Test LocalEnvironmentWrapper functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-        # Set up logger
-        self.logger = logging.getLogger("test")
-        self.logger.setLevel(logging.INFO)
-
+    @classmethod
+    def setUpClass(cls):
+        """Scan test_environment_files once for the whole class."""
         # Set environments_dir to test_environment_files
         test_dir = Path(__file__).parent.parent / "test_environment_files"
-        self.environments_dir = str(test_dir)
-
-    def tearDown(self):
-        """Clean up after tests."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def test_make_bt11_without_version(self):
-        """Test making bt11 game without version (should find latest)."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
-
-        wrapper = client.make(game_id="bt11", scorecard_id="test-scorecard-1")
-
-        self.assertIsNotNone(wrapper, "Wrapper should be created")
-        self.assertEqual(wrapper.environment_info.game_id, "bt11-fd9df0622a1a")
-        self.assertEqual(wrapper.scorecard_id, "test-scorecard-1")
-        self.assertIsNotNone(wrapper.environment_info.local_dir)
-
-    def test_make_bt11_with_version(self):
-        """Test making bt11 game with specific version."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
-
-        wrapper = client.make(
-            game_id="bt11-fd9df0622a1a", scorecard_id="test-scorecard-2"
-        )
-
-        self.assertIsNotNone(wrapper, "Wrapper should be created")
-        self.assertEqual(wrapper.environment_info.game_id, "bt11-fd9df0622a1a")
-        self.assertEqual(wrapper.scorecard_id, "test-scorecard-2")
-        self.assertIsNotNone(wrapper.environment_info.local_dir)
+        cls.environments_dir = str(test_dir)
+
+        # Shared client for tests that only make games; each uses its own scorecard.
+        # Built under the same environment the tests see, so no stray
+        # OPERATION_MODE or ENVIRONMENTS_DIR leaks into it.
+        with patch.dict(os.environ, {"ARC_API_KEY": "test-key-123"}, clear=True):
+            cls.client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=cls.environments_dir,
+                logger=_LOG,
+            )
+        # Nearly every test plays bt11; without the fixture skip the whole class
+        if cls.client.get_environment("bt11") is None:
+            raise unittest.SkipTest(f"bt11 fixture missing from {test_dir}")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared client and the scorecards it accumulated."""
+        del cls.client
+
+    def test_make_resolves_game_id(self):
+        """Test that make() resolves base ids and versions, and returns None otherwise."""
+        cases = [
+            # (game_id, scorecard_id, expected resolved game_id or None)
+            ("bt11", "test-scorecard-1", "bt11-fd9df0622a1a"),
+            ("bt11-fd9df0622a1a", "test-scorecard-2", "bt11-fd9df0622a1a"),
+            ("invalid", "test", None),
+            ("xxxx", "test", None),
+            ("bt11-wrongversion", "test", None),
+        ]
+        for game_id, scorecard_id, resolved in cases:
+            with self.subTest(game_id=game_id):
+                wrapper = self.client.make(game_id=game_id, scorecard_id=scorecard_id)
+
+                if resolved is None:
+                    self.assertIsNone(wrapper, f"{game_id} should return None")
+                    continue
+                self.assertIsNotNone(wrapper, "Wrapper should be created")
+                self.assertEqual(wrapper.environment_info.game_id, resolved)
+                self.assertEqual(wrapper.scorecard_id, scorecard_id)
+                self.assertIsNotNone(wrapper.environment_info.local_dir)
 
     def test_make_bt11_reset(self):
         """Test that reset() works and returns FrameDataRaw."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
-
-        wrapper = client.make(game_id="bt11", scorecard_id="test-reset")
+        wrapper = self.client.make(game_id="bt11", scorecard_id="test-reset")
 
         self.assertIsNotNone(wrapper)
 
@@ -105,13 +89,7 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
 
     def test_make_bt11_four_action3_steps(self):
         """Test that four ACTION3 (move left) steps get past the first level."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
-
-        wrapper = client.make(game_id="bt11", scorecard_id="test-action3")
+        wrapper = self.client.make(game_id="bt11", scorecard_id="test-action3")
 
         self.assertIsNotNone(wrapper)
 
@@ -122,12 +100,11 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
         initial_level = reset_frame.levels_completed
 
         # Perform four ACTION3 (move left) actions
-        for i in range(4):
-            frame_data = wrapper.step(GameAction.ACTION3)
-            self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
+        frames = wrapper.step_many([GameAction.ACTION3] * 4)
+        self.assertEqual(len(frames), 4)
+        for i, frame_data in enumerate(frames, 1):
+            self.assertIsNotNone(frame_data, f"Step {i} should return FrameDataRaw")
+        self.assertIs(wrapper.observation_space, frames[-1])
 
         # After 4 ACTION3 steps, should have advanced to next level
         # Score should have increased (level completion increases score)
@@ -151,15 +128,9 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
 
     def test_make_bt11_that_command_at_game_over_does_not_add_to_scorecard(self):
         """Test that four ACTION3 (move left) steps get past the first level."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
+        card_id = self.client.create_scorecard()
 
-        card_id = client.create_scorecard()
-
-        wrapper = client.make(game_id="bt11", scorecard_id=card_id)
+        wrapper = self.client.make(game_id="bt11", scorecard_id=card_id)
 
         self.assertIsNotNone(wrapper)
 
@@ -167,17 +138,11 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
         for i in range(4):
             frame_data = wrapper.step(GameAction.ACTION3)
             self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
 
         # Perform eight ACTION4 (move right) actions to get to game over
         for i in range(8):
             frame_data = wrapper.step(GameAction.ACTION4)
             self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
 
         self.assertEqual(frame_data.state, GameState.GAME_OVER)
 
@@ -192,58 +157,61 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
         for i in range(8):
             frame_data = wrapper.step(GameAction.ACTION3)
             self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
 
-        scorecard = client.get_scorecard(card_id)
+        scorecard = self.client.get_scorecard(card_id)
 
         # Step count for level 2 should be 17, 8 ACTION4s for Game Over, 1 RESET, 8 ACTION3s for Level 2
         self.assertEqual(scorecard.environments[0].runs[0].level_actions[1], 17)
 
-    def test_make_invalid_game_id(self):
-        """Test that invalid game_id format returns None."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
+    def test_guid_registered_once_scorecard_exists(self):
+        """Test that a guid is registered on a later step if the scorecard was missing."""
+        manager = self.client.scorecard_manager
+        card_id = self.client.create_scorecard()
+        # Take the scorecard away while make() resets the game
+        card = manager.scorecards.pop(card_id)
+        wrapper = self.client.make(game_id="bt11", scorecard_id=card_id)
+        self.assertIsNotNone(wrapper)
+        self.assertNotIn(wrapper.observation_space.guid, manager.guids)
 
-        wrapper = client.make(game_id="invalid", scorecard_id="test")
-        self.assertIsNone(wrapper, "Invalid game_id should return None")
+        manager.scorecards[card_id] = card
+        frame_data = wrapper.step(GameAction.ACTION3)
 
-    def test_make_game_not_found(self):
-        """Test that non-existent game returns None."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
+        self.assertEqual(manager.guids.get(frame_data.guid), card_id)
+        self.assertIs(manager.get_scorecard_from_guid(frame_data.guid), card)
 
-        wrapper = client.make(game_id="xxxx", scorecard_id="test")
-        self.assertIsNone(wrapper, "Non-existent game should return None")
+    def test_action_space_cached_per_response(self):
+        """Test that action_space is converted once per response."""
+        wrapper = self.client.make(game_id="bt11", scorecard_id="test-action-space")
+        self.assertIsNotNone(wrapper)
 
-    def test_make_with_wrong_version(self):
-        """Test that wrong version returns None."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
+        with patch.object(
+            GameAction, "from_id", wraps=GameAction.from_id
+        ) as mock_from_id:
+            action_space = wrapper.action_space
+            self.assertEqual(action_space, [GameAction.ACTION3, GameAction.ACTION4])
+            self.assertEqual(wrapper.action_space, action_space)
+            self.assertEqual(mock_from_id.call_count, 2)
+
+            wrapper.step(GameAction.ACTION3)
+            self.assertEqual(wrapper.action_space, action_space)
+            self.assertEqual(mock_from_id.call_count, 4)
+
+    def test_action_space_returns_a_copy(self):
+        """Test that modifying a returned action_space does not affect later reads."""
+        wrapper = self.client.make(game_id="bt11", scorecard_id="test-action-copy")
+        self.assertIsNotNone(wrapper)
 
-        wrapper = client.make(game_id="bt11-wrongversion", scorecard_id="test")
-        self.assertIsNone(wrapper, "Wrong version should return None")
+        action_space = wrapper.action_space
+        action_space.remove(GameAction.ACTION3)
+
+        self.assertEqual(wrapper.action_space, [GameAction.ACTION3, GameAction.ACTION4])
 
     def test_make_bt11_fd9df0622a1b_with_action6(self):
         """Test that bt33-a7c3f9d18b4e loads and four ACTION6 (GLICK) actions with x=1, y=1 get past the first level."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
+        wrapper = self.client.make(
+            game_id="bt33-a7c3f9d18b4e", scorecard_id="test-action6"
         )
 
-        wrapper = client.make(game_id="bt33-a7c3f9d18b4e", scorecard_id="test-action6")
-
         self.assertIsNotNone(wrapper, "Wrapper should be created")
         self.assertEqual(wrapper.environment_info.game_id, "bt33-a7c3f9d18b4e")
         self.assertEqual(wrapper.scorecard_id, "test-action6")
@@ -259,9 +227,6 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
         for i in range(4):
             frame_data = wrapper.step(GameAction.ACTION6, data={"x": 1, "y": 1})
             self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
 
         # After 4 ACTION6 steps, should have advanced to next level
         # Score should have increased (level completion increases score)
@@ -283,6 +248,164 @@ class TestLocalEnvironmentWrapper(unittest.TestCase):
         self.assertGreater(len(action_space), 0, "Action space should have actions")
         self.assertIn(GameAction.ACTION6, action_space, "ACTION6 should be available")
 
+    def test_recording_written_on_close(self):
+        """Test that close() writes all pending recording events."""
+        with tempfile.TemporaryDirectory() as recordings_dir:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=self.environments_dir,
+                recordings_dir=recordings_dir,
+                logger=_LOG,
+            )
+
+            wrapper = client.make(
+                game_id="bt11", scorecard_id="test-recording", save_recording=True
+            )
+            self.assertIsNotNone(wrapper)
+
+            for _ in range(3):
+                wrapper.step(GameAction.ACTION3)
+
+            recording_file = wrapper._recording_filename
+            self.assertIsNotNone(recording_file)
+
+            wrapper.close()
+            self.assertIsNone(wrapper._record_thread)
+
+            lines = recording_file.read_text(encoding="utf-8").splitlines()
+            # One event for the initial reset plus one per step
+            self.assertEqual(len(lines), 4)
+            event = json.loads(lines[-1])
+            self.assertIn("timestamp", event)
+            self.assertEqual(event["data"]["action_input"]["id"], "ACTION3")
+            self.assertEqual(len(event["data"]["frame"][0]), 64)
+
+    def test_recording_keeps_reasoning_as_passed(self):
+        """Test that changing reasoning after step() does not alter the recording."""
+        with tempfile.TemporaryDirectory() as recordings_dir:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=self.environments_dir,
+                recordings_dir=recordings_dir,
+                logger=_LOG,
+            )
+
+            wrapper = client.make(
+                game_id="bt11", scorecard_id="test-reasoning", save_recording=True
+            )
+            self.assertIsNotNone(wrapper)
+
+            # Agents commonly reuse one reasoning dict across steps
+            reasoning = {"thought": "move left"}
+            wrapper.step(GameAction.ACTION3, reasoning=reasoning)
+            reasoning["thought"] = "changed after step"
+
+            recording_file = wrapper._recording_filename
+            wrapper.close()
+
+            lines = recording_file.read_text(encoding="utf-8").splitlines()
+            event = json.loads(lines[-1])
+            self.assertEqual(
+                event["data"]["action_input"]["reasoning"], {"thought": "move left"}
+            )
+
+    def test_recording_keeps_frame_as_returned(self):
+        """Test that changing a returned frame before close() does not alter the recording."""
+        with tempfile.TemporaryDirectory() as recordings_dir:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=self.environments_dir,
+                recordings_dir=recordings_dir,
+                logger=_LOG,
+            )
+
+            wrapper = client.make(
+                game_id="bt11", scorecard_id="test-frame-copy", save_recording=True
+            )
+            self.assertIsNotNone(wrapper)
+
+            frame_data = wrapper.step(GameAction.ACTION3)
+            expected = frame_data.frame[0].copy()
+            self.assertTrue(expected.any())
+            frame_data.frame[0][:] = 0
+
+            recording_file = wrapper._recording_filename
+            wrapper.close()
+
+            lines = recording_file.read_text(encoding="utf-8").splitlines()
+            event = json.loads(lines[-1])
+            # array_equal rather than assertEqual, whose diff of a 64x64 grid is very slow
+            self.assertTrue(np.array_equal(event["data"]["frame"][0], expected))
+
+    def test_recording_flushed_on_game_over(self):
+        """Test that reaching GAME_OVER flushes buffered recording events."""
+        with tempfile.TemporaryDirectory() as recordings_dir:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=self.environments_dir,
+                recordings_dir=recordings_dir,
+                logger=_LOG,
+            )
+
+            wrapper = client.make(
+                game_id="bt11", scorecard_id="test-recording", save_recording=True
+            )
+            self.assertIsNotNone(wrapper)
+
+            for _ in range(4):
+                frame_data = wrapper.step(GameAction.ACTION4)
+            self.assertEqual(frame_data.state, GameState.GAME_OVER)
+
+            lines = wrapper._recording_filename.read_text(encoding="utf-8")
+            self.assertEqual(len(lines.splitlines()), 5)
+            wrapper.close()
+
+    def test_recording_keeps_frame_layers_as_arrays(self):
+        """Test that recorded frames are passed to the writer without tolist()."""
+        with tempfile.TemporaryDirectory() as recordings_dir:
+            client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=self.environments_dir,
+                recordings_dir=recordings_dir,
+                logger=_LOG,
+            )
+
+            wrapper = client.make(
+                game_id="bt11", scorecard_id="test-recording", save_recording=True
+            )
+            self.assertIsNotNone(wrapper)
+
+            with patch.object(wrapper, "_record") as mock_record:
+                wrapper.step(GameAction.ACTION3)
+
+            mock_record.assert_called_once()
+            frame = mock_record.call_args.args[0]["frame"]
+            self.assertIsInstance(frame[0], np.ndarray)
+            wrapper.close()
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_recording_serializers_agree(self):
+        """Test that the orjson and stdlib recording encoders produce the same data."""
+        timestamp = datetime(2026, 1, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+        event = {
+            "timestamp": timestamp,
+            "data": {
+                "state": "NOT_FINISHED",
+                "frame": [np.arange(6, dtype=np.int8).reshape(2, 3)],
+                "reasoning": {1: "non-string key"},
+            },
+        }
+
+        fast = _dumps_orjson(event)
+        fallback = _dumps_json(event)
+
+        self.assertTrue(fast.endswith(b"\n"))
+        self.assertTrue(fallback.endswith(b"\n"))
+        self.assertEqual(json.loads(fast), json.loads(fallback))
+        self.assertEqual(
+            json.loads(fallback)["data"]["frame"], [[[0, 1, 2], [3, 4, 5]]]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
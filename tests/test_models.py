@@ -12,15 +12,17 @@ from arc_agi import EnvironmentInfo
 class TestEnvironmentInfo(unittest.TestCase):
     """Test EnvironmentInfo model."""
 
+    # Fixed download time for tests that only need some timezone-aware datetime
+    FIXED_NOW = datetime(2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc)
+
+    # Canonical tg61 payload shared by the construction and deserialization tests
+    CANONICAL_JSON = '{"game_id": "tg61-28585068", "title": "TG61", "tags": ["tag1", "tag2"], "baseline_actions": [12, 17, 18, 22, 50]}'
+    CANONICAL_JSON_BYTES = CANONICAL_JSON.encode()
+    CANONICAL_DICT = json.loads(CANONICAL_JSON)
+
     def test_create_from_dict(self):
         """Test creating EnvironmentInfo from a dictionary."""
-        data = {
-            "game_id": "tg61-28585068",
-            "title": "TG61",
-            "tags": ["tag1", "tag2"],
-            "baseline_actions": [12, 17, 18, 22, 50],
-        }
-        env_info = EnvironmentInfo(**data)
+        env_info = EnvironmentInfo(**self.CANONICAL_DICT)
 
         self.assertEqual(env_info.game_id, "tg61-28585068")
         self.assertEqual(env_info.title, "TG61")
@@ -75,9 +77,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_deserialize_from_json_string(self):
         """Test deserializing EnvironmentInfo from JSON string."""
-        json_str = '{"game_id": "tg61-28585068", "title": "TG61", "tags": ["tag1", "tag2"], "baseline_actions": [12, 17, 18, 22, 50]}'
-
-        env_info = EnvironmentInfo.model_validate_json(json_str)
+        env_info = EnvironmentInfo.model_validate_json(self.CANONICAL_JSON)
 
         self.assertEqual(env_info.game_id, "tg61-28585068")
         self.assertEqual(env_info.title, "TG61")
@@ -86,9 +86,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_deserialize_from_json_bytes(self):
         """Test deserializing EnvironmentInfo from JSON bytes."""
-        json_bytes = b'{"game_id": "tg61-28585068", "title": "TG61", "tags": ["tag1", "tag2"], "baseline_actions": [12, 17, 18, 22, 50]}'
-
-        env_info = EnvironmentInfo.model_validate_json(json_bytes)
+        env_info = EnvironmentInfo.model_validate_json(self.CANONICAL_JSON_BYTES)
 
         self.assertEqual(env_info.game_id, "tg61-28585068")
         self.assertEqual(env_info.title, "TG61")
@@ -97,6 +95,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_round_trip_json(self):
         """Test round-trip serialization: object -> JSON -> object."""
+        # Validated on both sides, so the validator defaults must round-trip too
         original = EnvironmentInfo(
             game_id="tg61-28585068",
             title="TG61",
@@ -111,6 +110,9 @@ class TestEnvironmentInfo(unittest.TestCase):
         self.assertEqual(original.title, restored.title)
         self.assertEqual(original.tags, restored.tags)
         self.assertEqual(original.baseline_actions, restored.baseline_actions)
+        self.assertEqual(original.date_downloaded, restored.date_downloaded)
+        self.assertEqual(restored.class_name, "Tg61")
+        self.assertEqual(restored.default_fps, 5)
 
     def test_empty_tags(self):
         """Test EnvironmentInfo with empty tags list."""
@@ -134,54 +136,32 @@ class TestEnvironmentInfo(unittest.TestCase):
 
         self.assertEqual(env_info.baseline_actions, [])
 
-    def test_missing_game_id(self):
-        """Test that missing game_id raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                title="TG61",
-                tags=["tag1"],
-                baseline_actions=[12],
-            )
-
-    def test_invalid_game_id_type(self):
-        """Test that invalid game_id type raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id=12345,  # Should be string
-                title="TG61",
-                tags=["tag1"],
-                baseline_actions=[12],
-            )
-
-    def test_invalid_title_type(self):
-        """Test that invalid title type raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id="tg61-28585068",
-                title=12345,  # Should be string
-                tags=["tag1"],
-                baseline_actions=[12],
-            )
-
-    def test_invalid_tags_type(self):
-        """Test that invalid tags type raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id="tg61-28585068",
-                title="TG61",
-                tags="not-a-list",  # Should be list
-                baseline_actions=[12],
-            )
-
-    def test_invalid_baseline_actions_type(self):
-        """Test that invalid baseline_actions type raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id="tg61-28585068",
-                title="TG61",
-                tags=["tag1"],
-                baseline_actions="not-a-list",  # Should be list
-            )
+    def test_validation_errors(self):
+        """Test that missing or mistyped fields raise ValidationError."""
+        valid = {
+            "game_id": "tg61-28585068",
+            "title": "TG61",
+            "tags": ["tag1"],
+            "baseline_actions": [12],
+        }
+        cases = [
+            ("missing game_id", {"game_id": None}),
+            ("game_id not a string", {"game_id": 12345}),
+            ("title not a string", {"title": 12345}),
+            ("tags not a list", {"tags": "not-a-list"}),
+            ("baseline_actions not a list", {"baseline_actions": "not-a-list"}),
+            (
+                "baseline_actions non-numeric strings",
+                {"baseline_actions": ["not-a-number", "also-not-a-number"]},
+            ),
+            ("tags not strings", {"tags": [1, 2, 3]}),
+        ]
+        for name, overrides in cases:
+            # A None override drops the field entirely
+            data = {**valid, **overrides}
+            data = {key: value for key, value in data.items() if value is not None}
+            with self.subTest(name), self.assertRaises(ValidationError):
+                EnvironmentInfo(**data)
 
     def test_baseline_actions_with_numeric_strings(self):
         """Test that baseline_actions with numeric strings are coerced to integers."""
@@ -196,26 +176,6 @@ class TestEnvironmentInfo(unittest.TestCase):
         self.assertIsInstance(env_info.baseline_actions[0], int)
         self.assertIsInstance(env_info.baseline_actions[1], int)
 
-    def test_baseline_actions_with_non_numeric_strings(self):
-        """Test that baseline_actions with non-numeric strings raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id="tg61-28585068",
-                title="TG61",
-                tags=["tag1"],
-                baseline_actions=["not-a-number", "also-not-a-number"],
-            )
-
-    def test_tags_with_non_strings(self):
-        """Test that tags with non-strings raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            EnvironmentInfo(
-                game_id="tg61-28585068",
-                title="TG61",
-                tags=[1, 2, 3],  # Should be strings
-                baseline_actions=[12],
-            )
-
     def test_model_dump(self):
         """Test model_dump returns dictionary."""
         env_info = EnvironmentInfo(
@@ -231,17 +191,12 @@ class TestEnvironmentInfo(unittest.TestCase):
         self.assertEqual(dumped["title"], "TG61")
         self.assertEqual(dumped["tags"], ["tag1", "tag2"])
         self.assertEqual(dumped["baseline_actions"], [12, 17, 18, 22, 50])
+        self.assertEqual(dumped["class_name"], "Tg61")
+        self.assertIsNotNone(dumped["date_downloaded"])
 
     def test_model_validate_from_dict(self):
         """Test model_validate creates instance from dictionary."""
-        data = {
-            "game_id": "tg61-28585068",
-            "title": "TG61",
-            "tags": ["tag1", "tag2"],
-            "baseline_actions": [12, 17, 18, 22, 50],
-        }
-
-        env_info = EnvironmentInfo.model_validate(data)
+        env_info = EnvironmentInfo.model_validate(self.CANONICAL_DICT)
 
         self.assertEqual(env_info.game_id, "tg61-28585068")
         self.assertEqual(env_info.title, "TG61")
@@ -269,7 +224,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_date_downloaded_with_datetime(self):
         """Test that date_downloaded can be set to a datetime object."""
-        download_date = datetime.now(timezone.utc)
+        download_date = self.FIXED_NOW
         env_info = EnvironmentInfo(
             game_id="tg61-28585068",
             title="TG61",
@@ -313,8 +268,8 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_date_downloaded_round_trip(self):
         """Test round-trip serialization with date_downloaded."""
-        download_date = datetime.now(timezone.utc)
-        original = EnvironmentInfo(
+        download_date = self.FIXED_NOW
+        original = EnvironmentInfo.model_construct(
             game_id="tg61-28585068",
             title="TG61",
             tags=["tag1"],
@@ -330,7 +285,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_date_downloaded_from_dict(self):
         """Test creating EnvironmentInfo with date_downloaded from dictionary."""
-        download_date = datetime.now(timezone.utc)
+        download_date = self.FIXED_NOW
         data = {
             "game_id": "tg61-28585068",
             "title": "TG61",
@@ -405,7 +360,7 @@ class TestEnvironmentInfo(unittest.TestCase):
 
     def test_class_name_round_trip(self):
         """Test round-trip serialization with class_name."""
-        original = EnvironmentInfo(
+        original = EnvironmentInfo.model_construct(
             game_id="tg61-28585068",
             title="TG61",
             tags=["tag1"],
@@ -455,13 +410,11 @@ class TestEnvironmentInfo(unittest.TestCase):
             ("ABCD-123", "ABCD"),  # Capitalize first letter only, keep rest as-is
         ]
 
+        base_fields = {"title": "Test", "tags": ["tag1"], "baseline_actions": [12]}
         for game_id, expected_class_name in test_cases:
             with self.subTest(game_id=game_id):
-                env_info = EnvironmentInfo(
-                    game_id=game_id,
-                    title="Test",
-                    tags=["tag1"],
-                    baseline_actions=[12],
+                env_info = EnvironmentInfo.model_validate(
+                    {**base_fields, "game_id": game_id}
                 )
                 self.assertEqual(env_info.class_name, expected_class_name)
 
@@ -1,118 +1,41 @@
 """Tests for scorecard functionality using unittest."""
 
-import logging
 import os
-import sys
 import unittest
-from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
-# Create a mock dotenv module before any imports
-_mock_dotenv = MagicMock()
-_mock_dotenv.load_dotenv = MagicMock()
-sys.modules["dotenv"] = _mock_dotenv
+from arcengine import GameState
 
-# Now import arcagi3 - the mock will be used instead of real dotenv
-from arcengine import GameAction, GameState  # noqa: E402
-
-from arc_agi import (  # noqa: E402
-    Arcade,
+from arc_agi import (
     EnvironmentInfo,
     EnvironmentScore,
     EnvironmentScoreCalculator,
     EnvironmentScorecard,
-    OperationMode,  # noqa: E402
 )
+from arc_agi.scorecard import Card, Scorecard
 
+# Patched over os.environ with clear=True, so a caller's STALE_MINUTES or
+# MAX_OPEN_FOR_MINUTES cannot change the scorecards built here
+_TEST_ENV = {"ARC_API_KEY": "test-key-123"}
 
-class TestScorecard(unittest.TestCase):
-    """Test scorecard functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-        # Set up logger
-        self.logger = logging.getLogger("test")
-        self.logger.setLevel(logging.INFO)
-
-        # Set environments_dir to test_environment_files
-        test_dir = Path(__file__).parent.parent / "test_environment_files"
-        self.environments_dir = str(test_dir)
-
-    def tearDown(self):
-        """Clean up after tests."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def test_scorecard_bt11_four_action3(self):
-        """Test that playing bt11 with 4 Action3 actions results in levels_completed = 1."""
-        client = Arcade(
-            operation_mode=OperationMode.OFFLINE,
-            environments_dir=self.environments_dir,
-            logger=self.logger,
-        )
-
-        # Create a scorecard
-        scorecard_id = client.create_scorecard()
-        self.assertIsNotNone(scorecard_id)
-        self.logger.info(f"Created scorecard: {scorecard_id}")
-
-        # Make the environment
-        wrapper = client.make(game_id="bt11", scorecard_id=scorecard_id)
-        self.assertIsNotNone(wrapper)
-
-        # Reset the game
-        self.assertIsNotNone(wrapper.observation_space)
-        self.assertEqual(wrapper.observation_space.state, GameState.NOT_FINISHED)
-
-        # Perform four ACTION3 (move left) actions
-        for i in range(4):
-            frame_data = wrapper.step(GameAction.ACTION3)
-            self.assertIsNotNone(frame_data, f"Step {i + 1} should return FrameDataRaw")
-            self.logger.info(
-                f"Step {i + 1}: state={frame_data.state}, level={frame_data.levels_completed}"
-            )
-
-        # Get the scorecard and verify levels_completed
-        scorecard = client.get_scorecard(scorecard_id)
-        self.assertIsNotNone(scorecard)
-
-        # Get the card for bt11
-        bt11_card = scorecard.environments[0]
-        self.assertEqual(bt11_card.id, "bt11-fd9df0622a1a")
 
-        # Verify levels_completed is 1
-        # The card should have one guid (one play)
-        self.assertEqual(4, bt11_card.actions)
+def _bt11_win_card():
+    """Return a new bt11 Card: one winning play that beat level 1 in 10 actions."""
+    return Card(
+        game_id="bt11",
+        total_plays=1,
+        guids=["guid1"],
+        levels_completed=[1],
+        actions=[10],
+        resets=[0],
+        states=[GameState.WIN],
+        actions_by_level=[[(1, 10)]],
+    )
 
-        # Check levels_completed for this guid
-        self.assertEqual(
-            bt11_card.levels_completed,
-            1,
-            "levels_completed should be 1 after completing first level",
-        )
 
-        # Verify the final frame also shows level 1
-        final_frame = wrapper.observation_space
-        self.assertIsNotNone(final_frame)
-        self.assertEqual(
-            final_frame.levels_completed,
-            1,
-            "Final frame should show levels_completed = 1",
-        )
+def _scorecard(cards):
+    """Return a new Scorecard holding cards under the shared test card_id and key."""
+    return Scorecard(card_id="test-card", api_key="test-key", cards=cards)
 
 
 class TestEnvironmentScore(unittest.TestCase):
@@ -129,13 +52,16 @@ class TestEnvironmentScore(unittest.TestCase):
             completed=True,
             message="Test message",
         )
-        self.assertEqual(score.id, "test-id")
-        self.assertEqual(score.score, 85.5)
-        self.assertEqual(score.levels_completed, 3)
-        self.assertEqual(score.actions, 42)
-        self.assertEqual(score.resets, 2)
-        self.assertEqual(score.completed, True)
-        self.assertEqual(score.message, "Test message")
+        expected = {
+            "id": "test-id",
+            "score": 85.5,
+            "levels_completed": 3,
+            "actions": 42,
+            "resets": 2,
+            "completed": True,
+            "message": "Test message",
+        }
+        self.assertEqual(score.model_dump(include=set(expected)), expected)
 
     def test_environment_score_optional_fields(self):
         """Test that EnvironmentScore optional fields work correctly."""
@@ -188,75 +114,37 @@ class TestEnvironmentScore(unittest.TestCase):
         self.assertEqual(calculator.id, "test-id")
         self.assertIsNone(calculator.resets)
 
-    def test_add_level_completed(self):
-        """Test add_level with completed=True calculates score correctly."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        # Baseline: 10 actions, taken: 5 actions -> score = (10/5) * 100 = 200, capped at 115
-        calculator.add_level(
-            level_index=1, completed=True, actions_taken=5, baseline_actions=10
-        )
-        self.assertEqual(calculator.levels_completed, 1)
-        self.assertEqual(calculator.actions, 5)
-        self.assertEqual(len(calculator.level_scores), 1)
-        self.assertEqual(calculator.level_scores[0], 115.0)  # Capped at 100
-
-    def test_add_level_completed_exact_baseline(self):
-        """Test add_level with actions_taken equal to baseline."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        # Baseline: 10 actions, taken: 10 actions -> score = (10/10) * 100 = 100
-        calculator.add_level(
-            level_index=1, completed=True, actions_taken=10, baseline_actions=10
-        )
-        self.assertEqual(calculator.levels_completed, 1)
-        self.assertEqual(calculator.actions, 10)
-        self.assertEqual(calculator.level_scores[0], 100.0)
-
-    def test_add_level_completed_below_baseline(self):
-        """Test add_level with actions_taken below baseline."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        # Baseline: 10 actions, taken: 8 actions -> score = (10/8) * 100 = 125, capped at 115
-        calculator.add_level(
-            level_index=1, completed=True, actions_taken=8, baseline_actions=10
-        )
-        self.assertEqual(calculator.level_scores[0], 115.0)  # Capped at 115
-
-    def test_add_level_completed_above_baseline(self):
-        """Test add_level with actions_taken above baseline."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        # Baseline: 10 actions, taken: 20 actions -> score = (10/20) * 100 = 50
-        calculator.add_level(
-            level_index=1, completed=True, actions_taken=20, baseline_actions=10
-        )
-        self.assertEqual(calculator.level_scores[0], 25.0)
-
-    def test_add_level_not_completed(self):
-        """Test add_level with completed=False appends 0."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        calculator.add_level(
-            level_index=1, completed=False, actions_taken=15, baseline_actions=10
-        )
-        self.assertEqual(calculator.levels_completed, 0)  # Not incremented
-        self.assertEqual(calculator.actions, 15)  # Still added to total
-        self.assertEqual(len(calculator.level_scores), 1)
-        self.assertEqual(calculator.level_scores[0], 0.0)
-
-    def test_add_level_zero_actions(self):
-        """Test add_level with zero actions_taken."""
-        calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
-
-        calculator.add_level(
-            level_index=1, completed=True, actions_taken=0, baseline_actions=10
-        )
-        self.assertEqual(calculator.levels_completed, 1)
-        self.assertEqual(calculator.actions, 0)
-        self.assertEqual(
-            calculator.level_scores[0], 0.0
-        )  # Should be 0 if actions_taken is 0
+    def test_add_level_single(self):
+        """Test the score, level count and action total after one add_level call."""
+        cases = [
+            # (name, completed, actions_taken, baseline_actions,
+            #  expected score, expected levels_completed, expected actions)
+            # (10/5) * 100 = 200, capped at 115
+            ("completed", True, 5, 10, 115.0, 1, 5),
+            # (10/10) * 100 = 100
+            ("exact baseline", True, 10, 10, 100.0, 1, 10),
+            # (10/8) * 100 = 125, capped at 115
+            ("below baseline", True, 8, 10, 115.0, 1, 8),
+            # (10/20) * 100 = 50, squared as a fraction -> 25
+            ("above baseline", True, 20, 10, 25.0, 1, 20),
+            # Not completed scores 0 and is not counted, but its actions are
+            ("not completed", False, 15, 10, 0.0, 0, 15),
+            # Zero actions taken scores 0
+            ("zero actions", True, 0, 10, 0.0, 1, 0),
+        ]
+        for name, completed, taken, baseline, score, levels, actions in cases:
+            with self.subTest(name):
+                calculator = EnvironmentScoreCalculator(id="test-id", resets=0)
+
+                calculator.add_level(
+                    level_index=1,
+                    completed=completed,
+                    actions_taken=taken,
+                    baseline_actions=baseline,
+                )
+                self.assertEqual(calculator.level_scores, [score])
+                self.assertEqual(calculator.levels_completed, levels)
+                self.assertEqual(calculator.actions, actions)
 
     def test_add_level_multiple_levels(self):
         """Test adding multiple levels."""
@@ -301,11 +189,14 @@ class TestEnvironmentScore(unittest.TestCase):
 
         score = calculator.to_score()
         self.assertIsInstance(score, EnvironmentScore)
-        self.assertEqual(score.id, "test-id")
-        self.assertEqual(score.resets, 2)
-        self.assertEqual(score.completed, True)
-        self.assertEqual(score.levels_completed, 2)
-        self.assertEqual(score.actions, 35)  # 10 + 20 + 5
+        expected = {
+            "id": "test-id",
+            "resets": 2,
+            "completed": True,
+            "levels_completed": 2,
+            "actions": 35,  # 10 + 20 + 5
+        }
+        self.assertEqual(score.model_dump(include=set(expected)), expected)
         # Average: (100 + 25*2 + 0*3) / (1+2+3) = 50.0
         self.assertAlmostEqual(score.score, 25.0, places=5)
 
@@ -314,12 +205,15 @@ class TestEnvironmentScore(unittest.TestCase):
         calculator = EnvironmentScoreCalculator(id="test-id")
 
         score = calculator.to_score()
-        self.assertEqual(score.id, "test-id")
-        self.assertEqual(score.score, 0.0)
-        self.assertEqual(score.levels_completed, 0)
-        self.assertEqual(score.actions, 0)
-        self.assertIsNone(score.resets)
-        self.assertIsNone(score.completed)
+        expected = {
+            "id": "test-id",
+            "score": 0.0,
+            "levels_completed": 0,
+            "actions": 0,
+            "resets": None,
+            "completed": None,
+        }
+        self.assertEqual(score.model_dump(include=set(expected)), expected)
 
     def test_to_score_single_level(self):
         """Test to_score with single level."""
@@ -331,60 +225,27 @@ class TestEnvironmentScore(unittest.TestCase):
         calculator.completed = False  # Set completed flag
 
         score = calculator.to_score()
-        self.assertEqual(
-            score.score, ((10 / 15) ** 2) * 100
-        )  # Should be exact value, not average of one
-        self.assertEqual(score.levels_completed, 1)
-        self.assertEqual(score.actions, 15)
-        self.assertEqual(score.resets, 1)
-        self.assertEqual(score.completed, False)
-
-
+        expected = {
+            # Should be exact value, not average of one
+            "score": ((10 / 15) ** 2) * 100,
+            "levels_completed": 1,
+            "actions": 15,
+            "resets": 1,
+            "completed": False,
+        }
+        self.assertEqual(score.model_dump(include=set(expected)), expected)
+
+
+@patch.dict(os.environ, _TEST_ENV, clear=True)
 class TestEnvironmentScorecard(unittest.TestCase):
     """Test EnvironmentScorecard functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.env_vars_to_clear = [
-            "ARC_API_KEY",
-            "ARC_BASE_URL",
-            "OFFLINE_ONLY",
-            "ONLINE_ONLY",
-            "COMPETITION_MODE",
-            "LISTEN_BINDINGS",
-            "ENVIRONMENTS_DIR",
-        ]
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
-    def tearDown(self):
-        """Clean up after tests."""
-        for var in self.env_vars_to_clear:
-            os.environ.pop(var, None)
-        os.environ["ARC_API_KEY"] = "test-key-123"
-
     def test_from_scorecard_basic(self):
         """Test basic EnvironmentScorecard creation."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create a simple scorecard with one game
-        card = Card(
-            game_id="bt11",
-            total_plays=1,
-            guids=["guid1"],
-            levels_completed=[1],
-            actions=[10],
-            resets=[0],
-            states=[GameState.WIN],
-            actions_by_level=[[(1, 10)]],
-        )
+        card = _bt11_win_card()
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11",
@@ -406,8 +267,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_max_score_is_last_level_beaten(self):
         """Test basic EnvironmentScorecard creation."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create a simple scorecard with one game
         card = Card(
             game_id="bt11",
@@ -420,11 +279,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 8)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11",
@@ -471,8 +326,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_with_level_tags(self):
         """Test basic EnvironmentScorecard creation."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create a simple scorecard with one game
         card = Card(
             game_id="bt11",
@@ -485,11 +338,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 10), (2, 20), (3, 30), (4, 40), (5, 45)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11",
@@ -521,8 +370,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_highest_levels_completed(self):
         """Test that only the play with highest levels_completed is used."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create a card with multiple plays, where second has higher levels_completed
         card = Card(
             game_id="bt11",
@@ -535,11 +382,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 10)], [(1, 10), (2, 20)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11",
@@ -557,18 +400,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_multiple_games(self):
         """Test EnvironmentScorecard with multiple games."""
-        from arc_agi.scorecard import Card, Scorecard
-
-        card1 = Card(
-            game_id="bt11",
-            total_plays=1,
-            guids=["guid1"],
-            levels_completed=[1],
-            actions=[10],
-            resets=[0],
-            states=[GameState.WIN],
-            actions_by_level=[[(1, 10)]],
-        )
+        card1 = _bt11_win_card()
 
         card2 = Card(
             game_id="am92",
@@ -581,11 +413,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 15), (2, 30)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card1, "am92": card2},
-        )
+        scorecard = _scorecard({"bt11": card1, "am92": card2})
 
         env_info1 = EnvironmentInfo(
             game_id="bt11",
@@ -623,24 +451,9 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_missing_baseline_actions(self):
         """Test handling of missing baseline_actions."""
-        from arc_agi.scorecard import Card, Scorecard
-
-        card = Card(
-            game_id="bt11",
-            total_plays=1,
-            guids=["guid1"],
-            levels_completed=[1],
-            actions=[10],
-            resets=[0],
-            states=[GameState.WIN],
-            actions_by_level=[[(1, 10)]],
-        )
+        card = _bt11_win_card()
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         # EnvironmentInfo without baseline_actions
         env_info = EnvironmentInfo(
@@ -662,8 +475,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_baseline_size_mismatch(self):
         """Test handling of baseline_actions size mismatch."""
-        from arc_agi.scorecard import Card, Scorecard
-
         card = Card(
             game_id="bt11",
             total_plays=1,
@@ -675,11 +486,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 10), (2, 20), (3, 30)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         # EnvironmentInfo with fewer baseline_actions than levels_completed
         env_info = EnvironmentInfo(
@@ -698,8 +505,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_tags_scores(self):
         """Test that tags_scores are computed correctly."""
-        from arc_agi.scorecard import Card, Scorecard
-
         card1 = Card(
             game_id="bt11",
             total_plays=1,
@@ -722,11 +527,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 25)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card1, "am92": card2},
-        )
+        scorecard = _scorecard({"bt11": card1, "am92": card2})
 
         env_info1 = EnvironmentInfo(
             game_id="bt11",
@@ -789,8 +590,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_not_completed_games(self):
         """Test that tags_scores are computed correctly."""
-        from arc_agi.scorecard import Card, Scorecard
-
         card1 = Card(
             game_id="bt11",
             total_plays=1,
@@ -813,11 +612,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 25)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card1, "am92": card2},
-        )
+        scorecard = _scorecard({"bt11": card1, "am92": card2})
 
         env_info1 = EnvironmentInfo(
             game_id="bt11",
@@ -866,8 +661,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_completed_games_average_score_calculation(self):
         """Test that top-level score is correctly calculated as average."""
-        from arc_agi.scorecard import Card, Scorecard
-
         card1 = Card(
             game_id="bt11",
             total_plays=1,
@@ -890,11 +683,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 10)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card1, "am92": card2},
-        )
+        scorecard = _scorecard({"bt11": card1, "am92": card2})
 
         env_info1 = EnvironmentInfo(
             game_id="bt11",
@@ -919,13 +708,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_empty_scorecard(self):
         """Test EnvironmentScorecard with empty scorecard."""
-        from arc_agi.scorecard import Scorecard
-
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={},
-        )
+        scorecard = _scorecard({})
 
         scorecard_result = EnvironmentScorecard.from_scorecard(scorecard, [])
 
@@ -935,24 +718,9 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_no_matching_env_info(self):
         """Test EnvironmentScorecard when no matching EnvironmentInfo exists."""
-        from arc_agi.scorecard import Card, Scorecard
+        card = _bt11_win_card()
 
-        card = Card(
-            game_id="bt11",
-            total_plays=1,
-            guids=["guid1"],
-            levels_completed=[1],
-            actions=[10],
-            resets=[0],
-            states=[GameState.WIN],
-            actions_by_level=[[(1, 10)]],
-        )
-
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         # No matching EnvironmentInfo
         scorecard_result = EnvironmentScorecard.from_scorecard(scorecard, [])
@@ -967,8 +735,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_from_scorecard_multiple_plays_same_game(self):
         """Test that only best play is selected when multiple plays exist."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create card with 3 plays, middle one has highest levels_completed
         card = Card(
             game_id="bt11",
@@ -985,11 +751,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             ],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11": card},
-        )
+        scorecard = _scorecard({"bt11": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11",
@@ -1005,8 +767,6 @@ class TestEnvironmentScorecard(unittest.TestCase):
 
     def test_realistic_scorecard_for_bt11(self):
         """Test that only best play is selected when multiple plays exist."""
-        from arc_agi.scorecard import Card, Scorecard
-
         # Create card with 3 plays, middle one has highest levels_completed
         card = Card(
             game_id="bt11-fd9df0622a1a",
@@ -1019,11 +779,7 @@ class TestEnvironmentScorecard(unittest.TestCase):
             actions_by_level=[[(1, 4), (2, 12)]],
         )
 
-        scorecard = Scorecard(
-            card_id="test-card",
-            api_key="test-key",
-            cards={"bt11-fd9df0622a1a": card},
-        )
+        scorecard = _scorecard({"bt11-fd9df0622a1a": card})
 
         env_info = EnvironmentInfo(
             game_id="bt11-fd9df0622a1a",
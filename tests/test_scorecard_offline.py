@@ -0,0 +1,105 @@
+"""Tests for scorecards produced by playing offline environments."""
+
+import logging
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from arcengine import GameAction, GameState
+
+from arc_agi import Arcade, OperationMode
+
+# The only environment variable Arcade sees during these tests
+_TEST_ENV = {"ARC_API_KEY": "test-key-123"}
+
+# Resolved once at import; every test plays from the same fixture tree
+_TEST_ENV_DIR = str((Path(__file__).parent.parent / "test_environment_files").resolve())
+
+# Left at the default level, so debug records are dropped before formatting
+_LOG = logging.getLogger("test")
+
+
+@patch.dict(os.environ, _TEST_ENV, clear=True)
+class TestScorecard(unittest.TestCase):
+    """Test scorecard functionality."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Scan test_environment_files once for the whole class."""
+        cls.environments_dir = _TEST_ENV_DIR
+
+        # Shared client; tests only touch the scorecard they open in setUp
+        with patch.dict(os.environ, _TEST_ENV, clear=True):
+            cls.client = Arcade(
+                operation_mode=OperationMode.OFFLINE,
+                environments_dir=cls.environments_dir,
+                logger=_LOG,
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared client and the scorecards it accumulated."""
+        del cls.client
+
+    def setUp(self):
+        """Open a fresh scorecard for each test."""
+        self.scorecard_id = self.client.create_scorecard()
+
+    def test_scorecard_bt11_four_action3(self):
+        """Test that playing bt11 with 4 Action3 actions results in levels_completed = 1."""
+        client = self.client
+        scorecard_id = self.scorecard_id
+        self.assertIsNotNone(scorecard_id)
+        _LOG.debug("Created scorecard: %s", scorecard_id)
+
+        # Make the environment
+        wrapper = client.make(game_id="bt11", scorecard_id=scorecard_id)
+        self.assertIsNotNone(wrapper)
+
+        # Reset the game
+        self.assertIsNotNone(wrapper.observation_space)
+        self.assertEqual(wrapper.observation_space.state, GameState.NOT_FINISHED)
+
+        # Perform four ACTION3 (move left) actions
+        frames = wrapper.step_many([GameAction.ACTION3] * 4)
+        for i, frame_data in enumerate(frames, 1):
+            self.assertIsNotNone(frame_data, f"Step {i} should return FrameDataRaw")
+            _LOG.debug(
+                "Step %d: state=%s, level=%s",
+                i,
+                frame_data.state,
+                frame_data.levels_completed,
+            )
+
+        # Get the scorecard and verify levels_completed
+        scorecard = client.get_scorecard(scorecard_id)
+        self.assertIsNotNone(scorecard)
+
+        # Get the card for bt11
+        bt11_card = scorecard.environments[0]
+        self.assertEqual(bt11_card.id, "bt11-fd9df0622a1a")
+
+        # Verify levels_completed is 1
+        # The card should have one guid (one play)
+        self.assertEqual(4, bt11_card.actions)
+
+        # Check levels_completed for this guid
+        self.assertEqual(
+            bt11_card.levels_completed,
+            1,
+            "levels_completed should be 1 after completing first level",
+        )
+
+        # Verify the final frame also shows level 1
+        final_frame = wrapper.observation_space
+        self.assertIsNotNone(final_frame)
+        self.assertEqual(
+            final_frame.levels_completed,
+            1,
+            "Final frame should show levels_completed = 1",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()